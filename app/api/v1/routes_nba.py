@@ -1,10 +1,15 @@
 # app/api/v1/routes_nba.py
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
+from app.core.logging import logger
+from app.utils.http_cache import cached_model_response
 from app.services.espn_nba_client import (
     fetch_nba_scoreboard,
     fetch_nba_game_odds,
@@ -37,6 +42,7 @@ router = APIRouter(
 # -----------------------------------------------------------------------------
 @router.get("/games-with-odds", response_model=GamesWithOddsResponse)
 async def get_nba_games_with_odds(
+    request: Request,
     date: str = Query(
         ...,
         description="Fecha en formato YYYYMMDD (ej. 20251209)",
@@ -54,7 +60,7 @@ async def get_nba_games_with_odds(
     """
     date = date.strip()
 
-    sb = fetch_nba_scoreboard(date)
+    sb = await run_in_threadpool(fetch_nba_scoreboard, date)
     if not sb:
         raise HTTPException(
             status_code=502,
@@ -68,9 +74,16 @@ async def get_nba_games_with_odds(
             detail="No hay eventos NBA para esa fecha.",
         )
 
+    # Los fetchers de ESPN son bloqueantes: se ejecutan en el threadpool y las
+    # odds de todos los eventos se piden en paralelo.
+    odds_list = await asyncio.gather(
+        *(run_in_threadpool(fetch_nba_game_odds, str(ev.get("id"))) for ev in events),
+        return_exceptions=True,
+    )
+
     games_out: List[GameWithOdds] = []
 
-    for ev in events:
+    for ev, odds_raw in zip(events, odds_list):
         try:
             event_id = ev.get("id")
             name = ev.get("name")
@@ -94,7 +107,9 @@ async def get_nba_games_with_odds(
                 elif side == "away":
                     away_team = t_info
 
-            odds_raw = fetch_nba_game_odds(str(event_id))
+            if isinstance(odds_raw, Exception):
+                raise odds_raw
+
             odds_summary: Optional[GameOddsSummary] = None
 
             if odds_raw and "items" in odds_raw and odds_raw["items"]:
@@ -125,15 +140,17 @@ async def get_nba_games_with_odds(
             )
 
         except Exception as e:
-            print(f"[NBA] Error procesando juego: {e}")
+            logger.warning("[NBA] Error procesando juego %s: %s", ev.get("id"), e)
             continue
 
-    return GamesWithOddsResponse(
+    result = GamesWithOddsResponse(
         week=0,
         season_type=0,
         games=games_out,
     )
 
+    return cached_model_response(request, result)
+
 
 # -----------------------------------------------------------------------------
 # 2) ROSTER POR EQUIPO
@@ -162,7 +179,7 @@ async def get_nba_team_roster(team_abbr: str) -> Dict[str, Any]:
     """
     team_abbr = team_abbr.upper()
 
-    data = fetch_nba_team_with_roster(team_abbr)
+    data = await run_in_threadpool(fetch_nba_team_with_roster, team_abbr)
     if not data:
         raise HTTPException(
             status_code=502,
@@ -250,11 +267,15 @@ async def get_nba_team_roster(team_abbr: str) -> Dict[str, Any]:
             }
         )
 
-    return {
-        "team_abbr": team_abbr,
-        "team_name": team_name,
-        "players": players_out,
-    }
+    # Dict plano de str/None: orjson lo serializa directo, sin pasar por
+    # la validación del response_model ni jsonable_encoder jugador por jugador.
+    return ORJSONResponse(
+        {
+            "team_abbr": team_abbr,
+            "team_name": team_name,
+            "players": players_out,
+        }
+    )
 
 # -----------------------------------------------------------------------------
 # 3) GAMELOG CRUDO DE JUGADOR NBA
@@ -269,7 +290,8 @@ async def get_nba_player_gamelog(
     Devuelve el gamelog crudo de ESPN para un jugador NBA específico.
     """
     try:
-        data = fetch_nba_player_gamelog(
+        data = await run_in_threadpool(
+            fetch_nba_player_gamelog,
             athlete_id,
             season=season,
             season_type=season_type,
@@ -315,7 +337,7 @@ async def nba_wspm_auto_projection(payload: WSPMAutoRequest):
         # fallback razonable: hoy en UTC como YYYYMMDD
         scoreboard_date = datetime.utcnow().strftime("%Y%m%d")
 
-    sb = fetch_nba_scoreboard(scoreboard_date)
+    sb = await run_in_threadpool(fetch_nba_scoreboard, scoreboard_date)
     if not sb:
         raise HTTPException(
             status_code=502,
@@ -330,7 +352,7 @@ async def nba_wspm_auto_projection(payload: WSPMAutoRequest):
         )
 
     # 2) Odds del partido (para tempo)
-    odds_data = fetch_nba_game_odds(payload.event_id)
+    odds_data = await run_in_threadpool(fetch_nba_game_odds, payload.event_id)
     game_total: Optional[float] = None
 
     if odds_data and "items" in odds_data and odds_data["items"]:
@@ -342,7 +364,8 @@ async def nba_wspm_auto_projection(payload: WSPMAutoRequest):
 
     # 3) Gamelog del jugador
     try:
-        gamelog = fetch_nba_player_gamelog(
+        gamelog = await run_in_threadpool(
+            fetch_nba_player_gamelog,
             payload.athlete_id,
             season=payload.season,
             season_type=payload.season_type,
@@ -384,7 +407,6 @@ async def nba_wspm_auto_projection(payload: WSPMAutoRequest):
     edge = wspm_projection - book_line
     margin_pct = (edge / abs(book_line)) * 100.0 if book_line != 0 else 0.0
 
-    safety_margin_value = abs(edge)
     safety_margin_pct = abs(margin_pct)
 
     # 5) Prob cover simple
@@ -423,12 +445,7 @@ async def nba_wspm_auto_projection(payload: WSPMAutoRequest):
         adj_volume=adj_volume,
         adj_risk=adj_risk,
         adj_tempo=adj_tempo,
-        net_adjust=net_adjust,
         wspm_projection=wspm_projection,
-        edge=edge,
-        margin_pct=margin_pct,
-        safety_margin_value=safety_margin_value,
-        safety_margin_pct=safety_margin_pct,
         prob_cover=prob_cover,
         direction=direction,
         confidence=confidence,
@@ -454,7 +471,7 @@ async def nba_wspm_auto_projection_report(payload: WSPMAutoRequest):
     else:
         scoreboard_date = datetime.utcnow().strftime("%Y%m%d")
 
-    sb = fetch_nba_scoreboard(scoreboard_date)
+    sb = await run_in_threadpool(fetch_nba_scoreboard, scoreboard_date)
     if not sb:
         raise HTTPException(
             status_code=502,
@@ -470,7 +487,7 @@ async def nba_wspm_auto_projection_report(payload: WSPMAutoRequest):
 
     matchup = event.get("name", f"{payload.player_team} vs {payload.opponent_team}")
 
-    odds_data = fetch_nba_game_odds(payload.event_id)
+    odds_data = await run_in_threadpool(fetch_nba_game_odds, payload.event_id)
     game_total: Optional[float] = None
 
     if odds_data and "items" in odds_data and odds_data["items"]:
@@ -481,7 +498,8 @@ async def nba_wspm_auto_projection_report(payload: WSPMAutoRequest):
             game_total = None
 
     try:
-        gamelog = fetch_nba_player_gamelog(
+        gamelog = await run_in_threadpool(
+            fetch_nba_player_gamelog,
             payload.athlete_id,
             season=payload.season,
             season_type=payload.season_type,
@@ -642,11 +660,6 @@ El margen de seguridad respecto a la línea del book es de **{safety_margin_valu
         adj_volume=adj_volume,
         adj_risk=adj_risk,
         adj_tempo=adj_tempo,
-        net_adjust=net_adjust,
-        edge=edge,
-        margin_pct=margin_pct,
-        safety_margin_value=safety_margin_value,
-        safety_margin_pct=safety_margin_pct,
         prob_cover=prob_cover,
         confidence=confidence,
         game_total=game_total,
@@ -1,7 +1,12 @@
+import asyncio
 from typing import Dict, Any, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
+from app.core.logging import logger
+from app.utils.http_cache import cached_model_response
 from app.services.espn_nfl_client import fetch_scoreboard_data, fetch_game_odds
 from app.services.espn_nfl_players_client import fetch_player_gamelog
 from app.services.espn_nfl_roster_client import fetch_team_roster_by_abbr
@@ -40,6 +45,7 @@ router = APIRouter(
 
 @router.get("/scoreboard", response_model=ScoreboardResponse)
 async def get_nfl_scoreboard(
+    request: Request,
     week: int = Query(..., description="Semana de NFL, ej. 1 o 15", ge=1),
     season_type: int = Query(
         2,
@@ -48,7 +54,7 @@ async def get_nfl_scoreboard(
         le=3,
     ),
 ):
-    data = fetch_scoreboard_data(week, season_type)
+    data = await run_in_threadpool(fetch_scoreboard_data, week, season_type)
 
     if not data or "events" not in data or not data["events"]:
         raise HTTPException(
@@ -91,15 +97,17 @@ async def get_nfl_scoreboard(
                 )
             )
         except Exception as e:
-            print(f"Error parseando evento NFL: {e}")
+            logger.warning("[NFL] Error parseando evento %s: %s", ev.get("id"), e)
             continue
 
-    return ScoreboardResponse(
+    result = ScoreboardResponse(
         week=week,
         season_type=season_type,
         events=events_out,
     )
 
+    return cached_model_response(request, result)
+
 
 # ---------------------------------------------------------------------------
 # 2) ODDS POR PARTIDO
@@ -107,7 +115,7 @@ async def get_nfl_scoreboard(
 
 @router.get("/odds/{event_id}", response_model=OddsResponse)
 async def get_nfl_odds(event_id: str):
-    odds_data = fetch_game_odds(event_id)
+    odds_data = await run_in_threadpool(fetch_game_odds, event_id)
 
     if not odds_data or "items" not in odds_data or not odds_data["items"]:
         raise HTTPException(
@@ -167,7 +175,6 @@ async def wspm_projection(input_data: WSPMInput):
     else:
         margin_pct = 0.0
 
-    safety_margin_value = abs(edge)
     safety_margin_pct = abs(margin_pct)
 
     abs_m = safety_margin_pct
@@ -206,12 +213,7 @@ async def wspm_projection(input_data: WSPMInput):
         adj_volume=input_data.adj_volume,
         adj_risk=input_data.adj_risk,
         adj_tempo=input_data.adj_tempo,
-        net_adjust=net_adjust,
         wspm_projection=wspm_projection,
-        edge=edge,
-        margin_pct=margin_pct,
-        safety_margin_value=safety_margin_value,
-        safety_margin_pct=safety_margin_pct,
         prob_cover=prob_cover,
         direction=direction,
         confidence=confidence,
@@ -224,7 +226,18 @@ async def wspm_projection(input_data: WSPMInput):
 
 @router.post("/wspm/auto-projection", response_model=WSPMOutput)
 async def wspm_auto_projection(payload: WSPMAutoRequest):
-    scoreboard = fetch_scoreboard_data(payload.week, payload.season_type)
+    # Scoreboard, odds y gamelog son independientes: se piden en paralelo
+    # en el threadpool (los fetchers de ESPN son bloqueantes).
+    scoreboard, odds_data, gamelog = await asyncio.gather(
+        run_in_threadpool(fetch_scoreboard_data, payload.week, payload.season_type),
+        run_in_threadpool(fetch_game_odds, payload.event_id),
+        run_in_threadpool(
+            fetch_player_gamelog,
+            payload.athlete_id,
+            season=payload.season,
+            season_type=payload.season_type,
+        ),
+    )
     if not scoreboard or "events" not in scoreboard:
         raise HTTPException(
             status_code=502,
@@ -238,7 +251,6 @@ async def wspm_auto_projection(payload: WSPMAutoRequest):
             detail=f"No se encontró el evento {payload.event_id} en el scoreboard.",
         )
 
-    odds_data = fetch_game_odds(payload.event_id)
     game_total: Optional[float] = None
     if odds_data and "items" in odds_data and odds_data["items"]:
         first_item = odds_data["items"][0]
@@ -248,12 +260,6 @@ async def wspm_auto_projection(payload: WSPMAutoRequest):
         except (TypeError, ValueError):
             game_total = None
 
-    gamelog = fetch_player_gamelog(
-        payload.athlete_id,
-        season=payload.season,
-        season_type=payload.season_type,
-    )
-
     base_projection = compute_base_projection_from_gamelog(
         gamelog=gamelog,
         market_type=payload.market_type,
@@ -293,7 +299,6 @@ async def wspm_auto_projection(payload: WSPMAutoRequest):
     else:
         margin_pct = 0.0
 
-    safety_margin_value = abs(edge)
     safety_margin_pct = abs(margin_pct)
 
     if safety_margin_pct < 2:
@@ -331,12 +336,7 @@ async def wspm_auto_projection(payload: WSPMAutoRequest):
         adj_volume=adj_volume,
         adj_risk=adj_risk,
         adj_tempo=adj_tempo,
-        net_adjust=net_adjust,
         wspm_projection=wspm_projection,
-        edge=edge,
-        margin_pct=margin_pct,
-        safety_margin_value=safety_margin_value,
-        safety_margin_pct=safety_margin_pct,
         prob_cover=prob_cover,
         direction=direction,
         confidence=confidence,
@@ -349,7 +349,18 @@ async def wspm_auto_projection(payload: WSPMAutoRequest):
 
 @router.post("/wspm/auto-projection-report", response_model=WSPMFullReport)
 async def wspm_auto_projection_report(payload: WSPMAutoRequest):
-    scoreboard = fetch_scoreboard_data(payload.week, payload.season_type)
+    # Scoreboard, odds y gamelog son independientes: se piden en paralelo
+    # en el threadpool (los fetchers de ESPN son bloqueantes).
+    scoreboard, odds_data, gamelog = await asyncio.gather(
+        run_in_threadpool(fetch_scoreboard_data, payload.week, payload.season_type),
+        run_in_threadpool(fetch_game_odds, payload.event_id),
+        run_in_threadpool(
+            fetch_player_gamelog,
+            payload.athlete_id,
+            season=payload.season,
+            season_type=payload.season_type,
+        ),
+    )
     if not scoreboard or "events" not in scoreboard:
         raise HTTPException(
             status_code=502,
@@ -365,7 +376,6 @@ async def wspm_auto_projection_report(payload: WSPMAutoRequest):
 
     matchup = event.get("name", f"{payload.player_team} vs {payload.opponent_team}")
 
-    odds_data = fetch_game_odds(payload.event_id)
     game_total: Optional[float] = None
     if odds_data and "items" in odds_data and odds_data["items"]:
         first_item = odds_data["items"][0]
@@ -375,12 +385,6 @@ async def wspm_auto_projection_report(payload: WSPMAutoRequest):
         except (TypeError, ValueError):
             game_total = None
 
-    gamelog = fetch_player_gamelog(
-        payload.athlete_id,
-        season=payload.season,
-        season_type=payload.season_type,
-    )
-
     base_projection = compute_base_projection_from_gamelog(
         gamelog=gamelog,
         market_type=payload.market_type,
@@ -543,11 +547,6 @@ El margen de seguridad respecto a la línea del book es de **{margen_seguridad_s
         adj_volume=adj_volume,
         adj_risk=adj_risk,
         adj_tempo=adj_tempo,
-        net_adjust=net_adjust,
-        edge=edge,
-        margin_pct=margin_pct,
-        safety_margin_value=safety_margin_value,
-        safety_margin_pct=safety_margin_pct,
         prob_cover=prob_cover,
         confidence=confidence,
         game_total=game_total,
@@ -571,7 +570,9 @@ async def get_nfl_player_gamelog(
         le=3,
     ),
 ) -> Dict[str, Any]:
-    data = fetch_player_gamelog(athlete_id, season=season, season_type=season_type)
+    data = await run_in_threadpool(
+        fetch_player_gamelog, athlete_id, season=season, season_type=season_type
+    )
 
     if not data:
         raise HTTPException(
@@ -588,6 +589,7 @@ async def get_nfl_player_gamelog(
 
 @router.get("/games-with-odds", response_model=GamesWithOddsResponse)
 async def get_nfl_games_with_odds(
+    request: Request,
     week: int = Query(..., description="Semana de NFL, ej. 1 o 15", ge=1),
     season_type: int = Query(
         2,
@@ -596,7 +598,7 @@ async def get_nfl_games_with_odds(
         le=3,
     ),
 ):
-    scoreboard = fetch_scoreboard_data(week, season_type)
+    scoreboard = await run_in_threadpool(fetch_scoreboard_data, week, season_type)
 
     if not scoreboard or "events" not in scoreboard or not scoreboard["events"]:
         raise HTTPException(
@@ -604,9 +606,17 @@ async def get_nfl_games_with_odds(
             detail="No se encontraron eventos para esa semana/tipo de temporada.",
         )
 
+    events = scoreboard["events"]
+
+    # Odds de todos los eventos en paralelo (fetchers bloqueantes → threadpool)
+    odds_list = await asyncio.gather(
+        *(run_in_threadpool(fetch_game_odds, ev.get("id")) for ev in events),
+        return_exceptions=True,
+    )
+
     games_out: List[GameWithOdds] = []
 
-    for ev in scoreboard.get("events", []):
+    for ev, odds_data in zip(events, odds_list):
         try:
             event_id = ev.get("id")
             name = ev.get("name")
@@ -630,7 +640,8 @@ async def get_nfl_games_with_odds(
                 elif side == "away":
                     away_team = t_info
 
-            odds_data = fetch_game_odds(event_id)
+            if isinstance(odds_data, Exception):
+                raise odds_data
 
             odds_summary: Optional[GameOddsSummary] = None
 
@@ -662,15 +673,17 @@ async def get_nfl_games_with_odds(
             )
 
         except Exception as e:
-            print(f"Error procesando juego con odds: {e}")
+            logger.warning("[NFL] Error procesando juego con odds %s: %s", ev.get("id"), e)
             continue
 
-    return GamesWithOddsResponse(
+    result = GamesWithOddsResponse(
         week=week,
         season_type=season_type,
         games=games_out,
     )
 
+    return cached_model_response(request, result)
+
 
 # ---------------------------------------------------------------------------
 # 8) ROSTER POR EQUIPO (ABREVIATURA → JUGADORES ESPN)
@@ -678,7 +691,7 @@ async def get_nfl_games_with_odds(
 
 @router.get("/team/{team_abbr}/roster")
 async def get_team_roster(team_abbr: str) -> Dict[str, Any]:
-    roster = fetch_team_roster_by_abbr(team_abbr)
+    roster = await run_in_threadpool(fetch_team_roster_by_abbr, team_abbr)
     if not roster:
         raise HTTPException(
             status_code=502,
@@ -687,7 +700,9 @@ async def get_team_roster(team_abbr: str) -> Dict[str, Any]:
                 "Verifica que la abreviatura esté soportada por ESPN."
             ),
         )
-    return roster
+    # Dict plano de str/int/None: orjson lo serializa directo, sin pasar por
+    # la validación del response_model ni jsonable_encoder jugador por jugador.
+    return ORJSONResponse(roster)
 
 
 # ---------------------------------------------------------------------------
@@ -696,7 +711,7 @@ async def get_team_roster(team_abbr: str) -> Dict[str, Any]:
 
 @router.get("/teams", response_model=NFLTeamsResponse)
 async def get_nfl_teams():
-    teams_data = fetch_nfl_teams_simplified()
+    teams_data = await run_in_threadpool(fetch_nfl_teams_simplified)
 
     if not teams_data:
         raise HTTPException(
@@ -721,7 +736,9 @@ async def nfl_game_projection(input_data: GameProjectionInput):
     - Compara vs líneas del book (total y spread)
     """
     try:
-        result = compute_game_projection(
+        # Recorre varias semanas de scoreboards (I/O bloqueante): fuera del event loop
+        result = await run_in_threadpool(
+            compute_game_projection,
             event_id=input_data.event_id,
             week=input_data.week,
             season_type=input_data.season_type,
@@ -775,7 +792,9 @@ async def nfl_game_projection_report(input_data: GameProjectionInput):
     para mostrar / enviar.
     """
     try:
-        result = compute_game_projection(
+        # Recorre varias semanas de scoreboards (I/O bloqueante): fuera del event loop
+        result = await run_in_threadpool(
+            compute_game_projection,
             event_id=input_data.event_id,
             week=input_data.week,
             season_type=input_data.season_type,
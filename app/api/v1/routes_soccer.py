@@ -1,13 +1,17 @@
 # app/api/v1/routes_soccer.py
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from math import exp, factorial
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Response
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
 
 from app.config import settings
+from app.core.logging import logger
 from app.services.espn_soccer_client import (
+    _resolve_league_code,
     fetch_soccer_scoreboard_data,
     fetch_soccer_game_odds,
 )
@@ -23,6 +27,25 @@ router = APIRouter(
     tags=["soccer"],
 )
 
+# Dict vacío compartido (solo lectura) para fallbacks de `.get(...) or {}`
+_EMPTY: Dict[str, Any] = {}
+
+# Mapa de ligas resuelto una sola vez al importar (settings no cambia en runtime)
+_ALIAS_TO_CODE: Dict[str, str] = dict(settings.espn_soccer_leagues)
+
+# Respuesta constante de /tournaments
+_TOURNAMENTS_RESPONSE: Dict[str, Any] = {
+    "tournaments": [
+        {
+            "id": alias,
+            "league_code": code,
+            "label": alias.replace("_", " ").title(),
+            "is_default": code == settings.espn_soccer_default_league,
+        }
+        for alias, code in _ALIAS_TO_CODE.items()
+    ]
+}
+
 # =========================================================
 # Modelos Pydantic para proyección de partido
 # =========================================================
@@ -42,6 +65,8 @@ class SoccerGameProjectionRequest(BaseModel):
 
 
 class SoccerMarketProjection(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     market: str               # "OVER_25", "1X2", "DOUBLE_CHANCE"
     pick: str                 # ej: "OVER 2.5", "1", "X", "2", "1X", "X2", "12", "NO BET"
     confidence: str           # "Alta" | "Media-Alta" | "Media" | "Baja"
@@ -51,6 +76,8 @@ class SoccerMarketProjection(BaseModel):
 
 
 class SoccerGameProjection(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     league_code: str
 
@@ -311,20 +338,7 @@ async def list_soccer_tournaments() -> Dict[str, Any]:
     """
     Devuelve la lista de torneos (ligas) configurados en el backend.
     """
-    out: List[Dict[str, Any]] = []
-
-    for alias, code in settings.espn_soccer_leagues.items():
-        label = alias.replace("_", " ").title()
-        out.append(
-            {
-                "id": alias,
-                "league_code": code,
-                "label": label,
-                "is_default": code == settings.espn_soccer_default_league,
-            }
-        )
-
-    return {"tournaments": out}
+    return _TOURNAMENTS_RESPONSE
 
 
 # =========================================================
@@ -346,7 +360,7 @@ async def get_soccer_games_with_odds(
     """
     Lista de juegos de soccer para la liga seleccionada, con odds resumidas.
     """
-    scoreboard = fetch_soccer_scoreboard_data(league=league)
+    scoreboard = await run_in_threadpool(fetch_soccer_scoreboard_data, league=league)
 
     if (
         not scoreboard
@@ -358,9 +372,20 @@ async def get_soccer_games_with_odds(
             detail="No se encontraron juegos de soccer en el scoreboard para esta liga.",
         )
 
+    events = scoreboard["events"]
+
+    # Odds de todos los partidos en paralelo (fetchers bloqueantes → threadpool)
+    odds_list = await asyncio.gather(
+        *(
+            run_in_threadpool(fetch_soccer_game_odds, ev.get("id"), league=league)
+            for ev in events
+        ),
+        return_exceptions=True,
+    )
+
     games_out: List[GameWithOdds] = []
 
-    for ev in scoreboard.get("events", []):
+    for ev, odds_data in zip(events, odds_list):
         try:
             event_id = ev.get("id")
             name = ev.get("name")
@@ -369,22 +394,18 @@ async def get_soccer_games_with_odds(
             comp = competitions[0] if competitions else {}
             competitors = comp.get("competitors", [])
 
-            home_team: Optional[TeamInfo] = None
-            away_team: Optional[TeamInfo] = None
+            sides: Dict[Any, Optional[TeamInfo]] = {"home": None, "away": None}
 
             for c in competitors:
-                side = c.get("homeAway")
-                team = c.get("team", {}) or {}
-                t_info = TeamInfo(
+                team = c.get("team") or _EMPTY
+                sides[c.get("homeAway")] = TeamInfo(
                     name=team.get("displayName"),
                     abbr=team.get("abbreviation"),
                 )
-                if side == "home":
-                    home_team = t_info
-                elif side == "away":
-                    away_team = t_info
 
-            odds_data = fetch_soccer_game_odds(event_id, league=league)
+            if isinstance(odds_data, Exception):
+                raise odds_data
+
             odds_summary: Optional[GameOddsSummary] = None
 
             if odds_data and "items" in odds_data and odds_data["items"]:
@@ -410,22 +431,24 @@ async def get_soccer_games_with_odds(
                 GameWithOdds(
                     event_id=event_id,
                     matchup=name,
-                    home_team=home_team,
-                    away_team=away_team,
+                    home_team=sides["home"],
+                    away_team=sides["away"],
                     odds=odds_summary,
                 )
             )
 
         except Exception as e:
-            print(f"Error procesando juego de soccer con odds: {e}")
+            logger.warning("[SOCCER] Error procesando juego con odds %s: %s", ev.get("id"), e)
             continue
 
-    return GamesWithOddsResponse(
+    result = GamesWithOddsResponse(
         week=0,
         season_type=0,
         games=games_out,
     )
 
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
 
 # =========================================================
 # 3) Proyección de partido: Bayes + Poisson + "IA"
@@ -445,9 +468,15 @@ async def soccer_game_projection(payload: SoccerGameProjectionRequest):
       • Modelo de goles Poisson (matriz de resultados).
       • Ajuste tipo 'IA' (logistic) para calibrar Over 2.5.
     """
-    league = payload.league
-
-    scoreboard = fetch_soccer_scoreboard_data(league=league)
+    # Acepta alias ("laliga") o código ESPN directo ("esp.1"); el código
+    # resuelto es el mismo que se pide a ESPN y el que se devuelve
+    league_code = _resolve_league_code(payload.league)
+
+    # Scoreboard y odds no dependen entre sí: se piden en paralelo
+    scoreboard, odds_data = await asyncio.gather(
+        run_in_threadpool(fetch_soccer_scoreboard_data, league=league_code),
+        run_in_threadpool(fetch_soccer_game_odds, payload.event_id, league=league_code),
+    )
     if not scoreboard or "events" not in scoreboard:
         raise HTTPException(
             status_code=404,
@@ -468,25 +497,22 @@ async def soccer_game_projection(payload: SoccerGameProjectionRequest):
     comp = competitions[0] if competitions else {}
     competitors = comp.get("competitors", [])
 
-    home_team_info: Optional[TeamInfo] = None
-    away_team_info: Optional[TeamInfo] = None
-    home_comp_raw: Optional[Dict[str, Any]] = None
-    away_comp_raw: Optional[Dict[str, Any]] = None
+    sides: Dict[Any, Optional[TeamInfo]] = {"home": None, "away": None}
+    sides_raw: Dict[Any, Optional[Dict[str, Any]]] = {"home": None, "away": None}
 
     for c in competitors:
         side = c.get("homeAway")
-        team = c.get("team", {}) or {}
-        t_info = TeamInfo(
+        team = c.get("team") or _EMPTY
+        sides[side] = TeamInfo(
             name=team.get("displayName"),
             abbr=team.get("abbreviation"),
         )
+        sides_raw[side] = c
 
-        if side == "home":
-            home_team_info = t_info
-            home_comp_raw = c
-        elif side == "away":
-            away_team_info = t_info
-            away_comp_raw = c
+    home_team_info = sides["home"]
+    away_team_info = sides["away"]
+    home_comp_raw = sides_raw["home"]
+    away_comp_raw = sides_raw["away"]
 
     if not home_team_info or not away_team_info or not home_comp_raw or not away_comp_raw:
         raise HTTPException(
@@ -495,7 +521,6 @@ async def soccer_game_projection(payload: SoccerGameProjectionRequest):
         )
 
     # Odds (para total de goles)
-    odds_data = fetch_soccer_game_odds(payload.event_id, league=league)
     book_over_under: Optional[float] = None
 
     if odds_data and "items" in odds_data and odds_data["items"]:
@@ -591,10 +616,6 @@ async def soccer_game_projection(payload: SoccerGameProjectionRequest):
         note="Doble oportunidad construida a partir de las probabilidades 1X2 Poisson.",
     )
 
-    league_code = settings.espn_soccer_leagues.get(
-        payload.league, settings.espn_soccer_default_league
-    )
-
     return SoccerGameProjection(
         event_id=payload.event_id,
         league_code=league_code,
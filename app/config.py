@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -85,6 +85,13 @@ class Settings(BaseSettings):
     espn_cache_ttl_seconds: int = 900
     espn_timeout_seconds: int = 10
 
+    # =====================================================
+    # CORS
+    # =====================================================
+    # API pública de solo lectura: "*" sin credenciales. Para restringir,
+    # poner los orígenes exactos (ej: CORS_ALLOW_ORIGINS='["https://app.midominio.com"]')
+    cors_allow_origins: List[str] = Field(default_factory=lambda: ["*"])
+
     class Config:
         env_file = ".env"
 
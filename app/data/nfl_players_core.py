@@ -14,7 +14,8 @@ Campos esperados por el backend:
 - team: Abreviatura del equipo (DAL, DET, KC, etc.)
 - position: Posición (QB, RB, WR, TE...)
 - rank: Prioridad dentro del equipo (1 = más importante para props)
-- default_markets: dict con mercados por defecto y su "book_line" aproximada:
+- default_markets: mapping de solo lectura (MappingProxyType) con mercados por
+  defecto y su "book_line" aproximada (claves en MARKET_KEYS):
     - "passing_yards"
     - "rushing_yards"
     - "receiving_yards"
@@ -24,6 +25,17 @@ NOTA:
 - Los valores de default_markets son ejemplos, ajústalos según tu criterio/modelo.
 """
 
+import sys
+from types import MappingProxyType
+from typing import Tuple
+
+# Nombres de mercado internados una sola vez; úsalos en lugar de literales
+PASSING_YARDS = sys.intern("passing_yards")
+RUSHING_YARDS = sys.intern("rushing_yards")
+RECEIVING_YARDS = sys.intern("receiving_yards")
+
+MARKET_KEYS: Tuple[str, ...] = (PASSING_YARDS, RUSHING_YARDS, RECEIVING_YARDS)
+
 NFL_PLAYERS_CORE = {
     # ---------------------------------------------------------
     # DALLAS COWBOYS (DAL)
@@ -34,9 +46,9 @@ NFL_PLAYERS_CORE = {
         "team": "DAL",
         "position": "WR",
         "rank": 1,
-        "default_markets": {
-            "receiving_yards": 78.0,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 78.0,
+        }),
     },
     # QB Cowboys
     "ATH_DAL_QB": {
@@ -44,9 +56,9 @@ NFL_PLAYERS_CORE = {
         "team": "DAL",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 265.5,
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 265.5,
+        }),
     },
     # RB1 Cowboys
     "ATH_DAL_RB1": {
@@ -54,10 +66,10 @@ NFL_PLAYERS_CORE = {
         "team": "DAL",
         "position": "RB",
         "rank": 2,
-        "default_markets": {
-            "rushing_yards": 62.5,
-            "receiving_yards": 18.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 62.5,
+            RECEIVING_YARDS: 18.5,
+        }),
     },
     # WR2 / TE Cowboys
     "ATH_DAL_WR2": {
@@ -65,9 +77,9 @@ NFL_PLAYERS_CORE = {
         "team": "DAL",
         "position": "WR",
         "rank": 3,
-        "default_markets": {
-            "receiving_yards": 48.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 48.5,
+        }),
     },
 
     # ---------------------------------------------------------
@@ -79,9 +91,9 @@ NFL_PLAYERS_CORE = {
         "team": "DET",
         "position": "WR",
         "rank": 1,
-        "default_markets": {
-            "receiving_yards": 82.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 82.5,
+        }),
     },
     # QB Lions
     "ATH_DET_QB": {
@@ -89,9 +101,9 @@ NFL_PLAYERS_CORE = {
         "team": "DET",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 265.0,
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 265.0,
+        }),
     },
     # RB1 Lions
     "ATH_DET_RB1": {
@@ -99,10 +111,10 @@ NFL_PLAYERS_CORE = {
         "team": "DET",
         "position": "RB",
         "rank": 2,
-        "default_markets": {
-            "rushing_yards": 64.5,
-            "receiving_yards": 20.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 64.5,
+            RECEIVING_YARDS: 20.5,
+        }),
     },
     # TE / WR2 Lions
     "ATH_DET_LAPORTA": {
@@ -110,9 +122,9 @@ NFL_PLAYERS_CORE = {
         "team": "DET",
         "position": "TE",
         "rank": 3,
-        "default_markets": {
-            "receiving_yards": 49.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 49.5,
+        }),
     },
 
     # ---------------------------------------------------------
@@ -124,9 +136,9 @@ NFL_PLAYERS_CORE = {
         "team": "KC",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 280.5,
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 280.5,
+        }),
     },
     # TE1 Chiefs
     "ATH_KC_KELCE": {
@@ -134,9 +146,9 @@ NFL_PLAYERS_CORE = {
         "team": "KC",
         "position": "TE",
         "rank": 1,
-        "default_markets": {
-            "receiving_yards": 71.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 71.5,
+        }),
     },
     # WR1 Chiefs
     "ATH_KC_WR1": {
@@ -144,9 +156,9 @@ NFL_PLAYERS_CORE = {
         "team": "KC",
         "position": "WR",
         "rank": 2,
-        "default_markets": {
-            "receiving_yards": 60.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 60.5,
+        }),
     },
     # RB1 Chiefs
     "ATH_KC_RB1": {
@@ -154,10 +166,10 @@ NFL_PLAYERS_CORE = {
         "team": "KC",
         "position": "RB",
         "rank": 3,
-        "default_markets": {
-            "rushing_yards": 55.5,
-            "receiving_yards": 16.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 55.5,
+            RECEIVING_YARDS: 16.5,
+        }),
     },
 
     # ---------------------------------------------------------
@@ -169,10 +181,10 @@ NFL_PLAYERS_CORE = {
         "team": "PHI",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 245.5,
-            "rushing_yards": 35.5,  # si es QB dual
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 245.5,
+            RUSHING_YARDS: 35.5,  # si es QB dual
+        }),
     },
     # WR1 Eagles
     "ATH_PHI_WR1": {
@@ -180,9 +192,9 @@ NFL_PLAYERS_CORE = {
         "team": "PHI",
         "position": "WR",
         "rank": 1,
-        "default_markets": {
-            "receiving_yards": 78.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 78.5,
+        }),
     },
     # WR2 Eagles
     "ATH_PHI_WR2": {
@@ -190,9 +202,9 @@ NFL_PLAYERS_CORE = {
         "team": "PHI",
         "position": "WR",
         "rank": 2,
-        "default_markets": {
-            "receiving_yards": 62.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 62.5,
+        }),
     },
     # RB1 Eagles
     "ATH_PHI_RB1": {
@@ -200,10 +212,10 @@ NFL_PLAYERS_CORE = {
         "team": "PHI",
         "position": "RB",
         "rank": 3,
-        "default_markets": {
-            "rushing_yards": 63.5,
-            "receiving_yards": 15.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 63.5,
+            RECEIVING_YARDS: 15.5,
+        }),
     },
 
     # ---------------------------------------------------------
@@ -215,9 +227,9 @@ NFL_PLAYERS_CORE = {
         "team": "SF",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 255.5,
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 255.5,
+        }),
     },
     # RB1 49ers
     "ATH_SF_RB1": {
@@ -225,10 +237,10 @@ NFL_PLAYERS_CORE = {
         "team": "SF",
         "position": "RB",
         "rank": 1,
-        "default_markets": {
-            "rushing_yards": 82.5,
-            "receiving_yards": 28.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 82.5,
+            RECEIVING_YARDS: 28.5,
+        }),
     },
     # WR1 49ers
     "ATH_SF_WR1": {
@@ -236,9 +248,9 @@ NFL_PLAYERS_CORE = {
         "team": "SF",
         "position": "WR",
         "rank": 2,
-        "default_markets": {
-            "receiving_yards": 72.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 72.5,
+        }),
     },
     # WR2 / TE 49ers
     "ATH_SF_WR2": {
@@ -246,9 +258,9 @@ NFL_PLAYERS_CORE = {
         "team": "SF",
         "position": "TE",
         "rank": 3,
-        "default_markets": {
-            "receiving_yards": 55.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 55.5,
+        }),
     },
 
     # ---------------------------------------------------------
@@ -260,10 +272,10 @@ NFL_PLAYERS_CORE = {
         "team": "BAL",
         "position": "QB",
         "rank": 1,
-        "default_markets": {
-            "passing_yards": 225.5,
-            "rushing_yards": 45.5,  # si es QB corredor
-        },
+        "default_markets": MappingProxyType({
+            PASSING_YARDS: 225.5,
+            RUSHING_YARDS: 45.5,  # si es QB corredor
+        }),
     },
     # TE1 Ravens
     "ATH_BAL_TE1": {
@@ -271,9 +283,9 @@ NFL_PLAYERS_CORE = {
         "team": "BAL",
         "position": "TE",
         "rank": 1,
-        "default_markets": {
-            "receiving_yards": 60.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 60.5,
+        }),
     },
     # WR1 Ravens
     "ATH_BAL_WR1": {
@@ -281,9 +293,9 @@ NFL_PLAYERS_CORE = {
         "team": "BAL",
         "position": "WR",
         "rank": 2,
-        "default_markets": {
-            "receiving_yards": 58.5,
-        },
+        "default_markets": MappingProxyType({
+            RECEIVING_YARDS: 58.5,
+        }),
     },
     # RB1 Ravens
     "ATH_BAL_RB1": {
@@ -291,9 +303,9 @@ NFL_PLAYERS_CORE = {
         "team": "BAL",
         "position": "RB",
         "rank": 3,
-        "default_markets": {
-            "rushing_yards": 68.5,
-            "receiving_yards": 12.5,
-        },
+        "default_markets": MappingProxyType({
+            RUSHING_YARDS: 68.5,
+            RECEIVING_YARDS: 12.5,
+        }),
     },
 }
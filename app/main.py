@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.config import settings
 from app.api.v1.routes_health import router as health_router
 from app.api.v1.routes_nfl import router as nfl_router
 from app.api.v1.routes_nba import router as nba_router
@@ -11,14 +13,18 @@ app = FastAPI(
     title="WSPM API",
     description="Backend FastAPI para modelos WSPM con datos de ESPN (no oficial).",
     version="0.3.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # "*" + allow_credentials=True es inválido según la spec y obliga a
+    # reflejar el Origin en cada request; sin credenciales Starlette responde
+    # "*" directo, y con orígenes explícitos es una búsqueda en lista.
+    allow_origins=settings.cors_allow_origins,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Accept", "Content-Type", "If-None-Match"],
 )
 
 app.include_router(health_router, prefix="/api/v1")
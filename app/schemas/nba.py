@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NBAAthleteInput(BaseModel):
@@ -19,11 +19,15 @@ class NBAStreakRequest(BaseModel):
 
 
 class NBAStreakGroup(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     lines: List[str] = []
 
 
 class NBAStreakResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     season: int
     season_type: int
     min_streak: int
@@ -1,7 +1,7 @@
 # app/schemas/nfl.py
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 # ---------------------------------------------------------------------------
@@ -9,11 +9,15 @@ from pydantic import BaseModel, Field
 # ---------------------------------------------------------------------------
 
 class TeamInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = None
     abbr: Optional[str] = None
 
 
 class ScoreboardEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     matchup: str
     home_team: Optional[TeamInfo] = None
@@ -21,18 +25,24 @@ class ScoreboardEvent(BaseModel):
 
 
 class ScoreboardResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     week: int
     season_type: int
     events: List[ScoreboardEvent]
 
 
 class OddsBook(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     provider: str
     details: str
     over_under: Optional[float] = None
 
 
 class OddsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     books: List[OddsBook]
     raw_count: int
@@ -69,6 +79,8 @@ class WSPMOutput(BaseModel):
     """
     Salida estándar del modelo WSPM (manual o auto).
     """
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     player_name: str
     player_team: str
@@ -83,13 +95,8 @@ class WSPMOutput(BaseModel):
     adj_risk: float
     adj_tempo: float
 
-    net_adjust: float
+    # Normalmente base_projection + net_adjust, salvo model_projection manual
     wspm_projection: float
-    edge: float
-    margin_pct: float
-
-    safety_margin_value: float
-    safety_margin_pct: float
 
     prob_cover: float
     direction: str    # "OVER" / "UNDER"
@@ -99,6 +106,34 @@ class WSPMOutput(BaseModel):
     game_total: Optional[float] = None
     analysis: Optional[str] = None
 
+    # Derivados de los campos anteriores (se calculan al serializar)
+    @computed_field
+    @property
+    def net_adjust(self) -> float:
+        return self.adj_matchup + self.adj_volume + self.adj_risk + self.adj_tempo
+
+    @computed_field
+    @property
+    def edge(self) -> float:
+        return self.wspm_projection - self.book_line
+
+    @computed_field
+    @property
+    def margin_pct(self) -> float:
+        if self.book_line == 0:
+            return 0.0
+        return (self.edge / abs(self.book_line)) * 100.0
+
+    @computed_field
+    @property
+    def safety_margin_value(self) -> float:
+        return abs(self.edge)
+
+    @computed_field
+    @property
+    def safety_margin_pct(self) -> float:
+        return abs(self.margin_pct)
+
 
 # ---------------------------------------------------------------------------
 # 3) WSPM AUTO (REQUEST)
@@ -135,12 +170,16 @@ class WSPMAutoRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 class GameOddsSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     provider: str
     details: str
     over_under: Optional[float] = None
 
 
 class GameWithOdds(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     matchup: str
     home_team: Optional[TeamInfo] = None
@@ -149,6 +188,8 @@ class GameWithOdds(BaseModel):
 
 
 class GamesWithOddsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     week: int
     season_type: int
     games: List[GameWithOdds]
@@ -159,6 +200,8 @@ class GamesWithOddsResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 class NFLTeam(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     team_id: str
     abbr: str
     name: str
@@ -168,6 +211,8 @@ class NFLTeam(BaseModel):
 
 
 class NFLTeamsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     count: int
     teams: List[NFLTeam]
 
@@ -177,12 +222,16 @@ class NFLTeamsResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 class WSPMVariableBreakdown(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     weight: float
 
 
 class WSPMFullReport(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     # Datos básicos del contexto
     event_id: str
     matchup: str
@@ -203,11 +252,6 @@ class WSPMFullReport(BaseModel):
     adj_volume: float
     adj_risk: float
     adj_tempo: float
-    net_adjust: float
-    edge: float
-    margin_pct: float
-    safety_margin_value: float
-    safety_margin_pct: float
     prob_cover: float
     confidence: str
 
@@ -219,6 +263,34 @@ class WSPMFullReport(BaseModel):
 
     # Reporte ya formateado tipo prompt que quieres vender
     markdown_report: str
+
+    # Derivados de los campos anteriores (se calculan al serializar)
+    @computed_field
+    @property
+    def net_adjust(self) -> float:
+        return self.adj_matchup + self.adj_volume + self.adj_risk + self.adj_tempo
+
+    @computed_field
+    @property
+    def edge(self) -> float:
+        return self.wspm_projection - self.book_line
+
+    @computed_field
+    @property
+    def margin_pct(self) -> float:
+        if self.book_line == 0:
+            return 0.0
+        return (self.edge / abs(self.book_line)) * 100.0
+
+    @computed_field
+    @property
+    def safety_margin_value(self) -> float:
+        return abs(self.edge)
+
+    @computed_field
+    @property
+    def safety_margin_pct(self) -> float:
+        return abs(self.margin_pct)
 # ======================================================================
 #  GAME LEVEL – PROYECCIÓN DE TOTAL Y SPREAD
 # ======================================================================
@@ -233,6 +305,8 @@ class GameProjectionInput(BaseModel):
 
 
 class GameProjectionOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     matchup: str
     home_team: TeamInfo
@@ -1,7 +1,7 @@
 # app/schemas/soccer.py
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.nfl import TeamInfo
 
@@ -15,6 +15,8 @@ class SoccerGameProjectionRequest(BaseModel):
 
 
 class SoccerGameProjectionOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     matchup: str
 
@@ -1,14 +1,48 @@
 # app/services/cache.py
 
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Hashable
 
-# Caché en memoria muy simple
-_cache: Dict[
-    Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]],
-    Tuple[float, Any]
-] = {}
+# Máximo de entradas antes de expulsar la menos usada (LRU)
+_MAX = 4096
+# Cada cuántas inserciones se barren las entradas ya expiradas
+_SWEEP_EVERY = 256
+# Lock por clave: un miss sobre la misma clave solo llama a ESPN una vez, y
+# claves distintas nunca se esperan entre sí. Se liberan solos al no usarse.
+_key_locks: "weakref.WeakValueDictionary[Hashable, threading.Lock]" = weakref.WeakValueDictionary()
+_key_locks_guard = threading.Lock()
+
+
+@dataclass(slots=True)
+class _Entry:
+    exp_ns: int
+    value: Any
+
+
+# Caché en memoria acotada: clave -> _Entry (mutable para refrescar el TTL in-place)
+_cache: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+_inserts = 0
+
+
+def _sweep_expired(now_ns: int) -> None:
+    """Elimina todas las entradas cuyo TTL ya venció."""
+    # list() copia los items de una vez para no iterar mientras otro hilo muta
+    expired = [k for k, entry in list(_cache.items()) if entry.exp_ns <= now_ns]
+    for k in expired:
+        _cache.pop(k, None)
+
+
+def _lock_for(key: Hashable) -> threading.Lock:
+    with _key_locks_guard:
+        lock = _key_locks.get(key)
+        if lock is None:
+            lock = _key_locks[key] = threading.Lock()
+        return lock
 
 
 def ttl_cache_json(ttl_seconds: int = 300):
@@ -20,25 +54,55 @@ def ttl_cache_json(ttl_seconds: int = 300):
         def fetch_xxx(...):
             ...
     """
+    ttl_ns = ttl_seconds * 1_000_000_000
+
     def decorator(func: Callable):
+        # Identificador de la función calculado una sola vez
+        fid = id(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            key = (
-                func.__module__ + "." + func.__name__,
-                args,
-                tuple(sorted(kwargs.items())),
-            )
-            now = time.time()
-
-            # Si está en cache y no ha expirado → devolver
-            if key in _cache:
-                expires_at, value = _cache[key]
-                if now < expires_at:
-                    return value
-
-            # Si no, llamar a la función y cachear
-            result = func(*args, **kwargs)
-            _cache[key] = (now + ttl_seconds, result)
+            global _inserts
+
+            if kwargs:
+                key = (fid, args, frozenset(kwargs.items()))
+            else:
+                key = (fid, args)
+            now_ns = time.monotonic_ns()
+
+            # Camino rápido sin lock: si está en cache y no ha expirado → devolver
+            entry = _cache.get(key)
+            if entry is not None and now_ns < entry.exp_ns:
+                try:
+                    _cache.move_to_end(key)
+                except KeyError:
+                    # Otro hilo la expulsó entre el get y el move_to_end
+                    pass
+                return entry.value
+
+            # Miss: single-flight por clave, se re-chequea dentro del lock
+            with _lock_for(key):
+                now_ns = time.monotonic_ns()
+                entry = _cache.get(key)
+                if entry is not None and now_ns < entry.exp_ns:
+                    return entry.value
+
+                result = func(*args, **kwargs)
+                if entry is not None:
+                    entry.exp_ns = now_ns + ttl_ns
+                    entry.value = result
+                    # pop + set la deja al final sin depender de que siga presente
+                    _cache.pop(key, None)
+                    _cache[key] = entry
+                else:
+                    _cache[key] = _Entry(now_ns + ttl_ns, result)
+                    if len(_cache) > _MAX:
+                        _cache.popitem(last=False)
+
+                _inserts += 1
+                if _inserts % _SWEEP_EVERY == 0:
+                    _sweep_expired(now_ns)
+
             return result
 
         return wrapper
@@ -0,0 +1,99 @@
+# app/services/espn_http.py
+
+"""
+Sesión HTTP compartida para los clientes de ESPN.
+
+Una sola requests.Session con pool de conexiones: las llamadas repetidas a
+site.api.espn.com / sports.core.api.espn.com reutilizan conexiones keep-alive
+en lugar de abrir TCP + TLS en cada request.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from app.config import settings
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson viene en requirements.txt
+    import json
+
+    _loads = json.loads
+
+SESSION = requests.Session()
+
+# Reintentos cortos solo ante rate-limit / errores transitorios de ESPN
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+)
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# ACCEPT_ENCODING solo anuncia lo que urllib3 sabe descomprimir
+# ("br" aparece únicamente si el paquete brotli está instalado).
+SESSION.headers.update(
+    {
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "User-Agent": "wspm/0.3",
+    }
+)
+
+# Errores esperables de get_json: red/HTTP o JSON inválido
+# (orjson.JSONDecodeError y json.JSONDecodeError heredan de ValueError).
+ESPN_ERRORS = (requests.RequestException, ValueError)
+
+
+def get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = settings.espn_timeout_seconds,
+) -> Any:
+    """
+    GET a ESPN con la sesión compartida y decodifica el cuerpo con orjson.
+
+    Lanza requests.RequestException si falla la red / status HTTP
+    y ValueError si el cuerpo no es JSON.
+    """
+    resp = SESSION.get(url, params=params, timeout=timeout)
+    resp.raise_for_status()
+    return _loads(resp.content)
+
+
+# url -> (ETag, JSON ya parseado). Solo para catálogos (pocas URLs fijas).
+_CONDITIONAL: Dict[str, Tuple[str, Any]] = {}
+
+
+def get_json_conditional(
+    url: str,
+    timeout: float = settings.espn_timeout_seconds,
+) -> Any:
+    """
+    Igual que get_json pero con If-None-Match: si ESPN responde 304 se
+    devuelve el JSON ya parseado de la vez anterior (sin bajar ni parsear
+    el cuerpo). Pensado para catálogos como /teams que casi nunca cambian;
+    el resultado se comparte entre llamadas, así que no debe mutarse.
+    """
+    cached = _CONDITIONAL.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    resp = SESSION.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cached:
+        return cached[1]
+
+    resp.raise_for_status()
+    data = _loads(resp.content)
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        _CONDITIONAL[url] = (etag, data)
+    return data
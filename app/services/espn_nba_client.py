@@ -1,21 +1,27 @@
 # app/services/espn_nba_client.py
 
+import re
 from typing import Optional, Dict, Any
 
-import requests
-
 from app.config import settings
-from app.utils.cache import get_from_cache, set_in_cache
+from app.services.espn_http import ESPN_ERRORS, get_json
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
 # Base URLs desde settings
 BASE_URL_SITE = settings.espn_nba_site_base_url
 BASE_URL_CORE = settings.espn_nba_core_base_url
 
+# Fechas de scoreboard: YYYYMMDD
+_DATE_RE = re.compile(r"\d{8}")
+# Abreviaturas de equipo ESPN: 2-4 letras (GS, LAL, UTAH)
+_ABBR_RE = re.compile(r"[A-Z]{2,4}")
+
 
 # ---------------------------------------------------------
 # SCOREBOARD
 # ---------------------------------------------------------
+@single_flight
 def fetch_nba_scoreboard(date: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Scoreboard NBA para una fecha específica YYYYMMDD.
@@ -25,37 +31,42 @@ def fetch_nba_scoreboard(date: str, use_cache: bool = True) -> Optional[Dict[str
         logger.error("[ESPN][NBA] Fecha vacía al solicitar scoreboard.")
         return None
 
-    cache_key = f"nba:scoreboard:{date}"
+    if not _DATE_RE.fullmatch(date):
+        logger.error("[ESPN][NBA] Fecha inválida al solicitar scoreboard: %s", date)
+        return None
+
+    cache_key = f"nba:scoreboard:date:{date}"
 
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NBA] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NBA] Cache HIT para %s", cache_key)
             return cached
 
     url = f"{BASE_URL_SITE}/scoreboard"
     params = {"dates": date}
 
-    logger.info(f"[ESPN][NBA] Fetch scoreboard: {url} params={params}")
+    logger.info("[ESPN][NBA] Fetch scoreboard: %s params=%s", url, params)
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(url, params=params)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NBA] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NBA] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NBA] Error al obtener scoreboard: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NBA] Error al obtener scoreboard: %s", e)
         return None
 
 
 # ---------------------------------------------------------
 # ODDS
 # ---------------------------------------------------------
+@single_flight
 def fetch_nba_game_odds(event_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Odds de un partido NBA por event_id.
@@ -68,32 +79,33 @@ def fetch_nba_game_odds(event_id: str, use_cache: bool = True) -> Optional[Dict[
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NBA] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NBA] Cache HIT para %s", cache_key)
             return cached
 
     # Mismo patrón que NFL: events/{event_id}/competitions/{event_id}/odds
     url = f"{BASE_URL_CORE}/events/{event_id}/competitions/{event_id}/odds"
 
-    logger.info(f"[ESPN][NBA] Fetch odds: {url}")
+    logger.info("[ESPN][NBA] Fetch odds: %s", url)
 
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NBA] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NBA] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NBA] Error al obtener odds para {event_id}: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NBA] Error al obtener odds para %s: %s", event_id, e)
         return None
 
 
 # ---------------------------------------------------------
 # TEAM + ROSTER
 # ---------------------------------------------------------
+@single_flight
 def fetch_nba_team_with_roster(team_abbr: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Obtiene la info del equipo NBA (por abreviatura) incluyendo el roster.
@@ -115,33 +127,34 @@ def fetch_nba_team_with_roster(team_abbr: str, use_cache: bool = True) -> Option
         }
       }
     """
-    if not team_abbr:
+    team_abbr = (team_abbr or "").upper().strip()
+    if not _ABBR_RE.fullmatch(team_abbr):
+        # Basura / bots: se descarta antes de tocar ESPN
         return None
 
-    team_abbr = team_abbr.upper()
     cache_key = f"nba:team:{team_abbr}:roster"
 
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NBA] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NBA] Cache HIT para %s", cache_key)
             return cached
 
     url = f"{BASE_URL_SITE}/teams/{team_abbr}"
     params = {"enable": "roster,projection,statistics"}
 
-    logger.info(f"[ESPN][NBA] Fetch team+roster: {url} params={params}")
+    logger.info("[ESPN][NBA] Fetch team+roster: %s params=%s", url, params)
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(url, params=params)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NBA] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NBA] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NBA] Error al obtener team+roster para {team_abbr}: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NBA] Error al obtener team+roster para %s: %s", team_abbr, e)
         return None
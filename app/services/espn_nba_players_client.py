@@ -1,26 +1,39 @@
-import re
-import requests
 from typing import Any, Dict
 
 from app.config import settings
+from app.services.espn_http import get_json
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
 BASE_URL_WEB = settings.espn_nba_web_base_url
 
 
+@single_flight
 def fetch_nba_player_gamelog(
     athlete_id: str,
     season: int,
     season_type: int = 2,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Gamelog crudo ESPN para un jugador NBA.
+
+    El dict devuelto se comparte entre llamadas (caché): no debe mutarse.
     """
     athlete_id = str(athlete_id).strip()
 
-    if not re.fullmatch(r"\d+", athlete_id):
+    # isdecimal() equivale a fullmatch(r"\d+") sin pasar por el motor de regex
+    if not athlete_id.isdecimal():
         raise ValueError(f"athlete_id inválido: {athlete_id}")
 
+    cache_key = f"nba:gamelog:{athlete_id}:{season}:{season_type}"
+
+    if use_cache:
+        cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
+        if cached is not None:
+            logger.debug("[ESPN][NBA] Cache HIT para %s", cache_key)
+            return cached
+
     url = f"{BASE_URL_WEB}/athletes/{athlete_id}/gamelog"
 
     params = {
@@ -28,12 +41,14 @@ def fetch_nba_player_gamelog(
         "seasonType": season_type,
     }
 
-    logger.info(f"[ESPN][NBA] Fetch gamelog: {url} params={params}")
+    logger.info("[ESPN][NBA] Fetch gamelog: %s params=%s", url, params)
+
+    data = get_json(url, params=params)
+
+    if use_cache:
+        set_in_cache(
+            cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+        )
+        logger.info("[ESPN][NBA] Cache SET para %s", cache_key)
 
-    resp = requests.get(
-        url,
-        params=params,
-        timeout=getattr(settings, "espn_timeout_seconds", 10),
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return data
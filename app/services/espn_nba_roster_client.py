@@ -1,25 +1,82 @@
-import requests
-from typing import Any, Dict, Optional, List
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, List, Tuple
 
 from app.config import settings
-from app.utils.cache import get_from_cache, set_in_cache
+from app.services.espn_http import get_json, get_json_conditional
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
 BASE_URL_SITE = settings.espn_nba_site_base_url
 
+# Índice abbr -> (team_id, displayName) del catálogo NBA, con TTL propio
+# (mismo patrón que TEAM_ID_CACHE en el cliente de roster NFL).
+_TEAM_INDEX: Dict[str, Tuple[str, Optional[str]]] = {}
+_team_index_expire_at = 0.0
+# Serializa las recargas del catálogo: con el índice vencido solo un hilo va a ESPN
+_TEAM_INDEX_LOCK = threading.Lock()
+# Abreviaturas de equipo ESPN: 2-4 letras (GS, LAL, UTAH)
+_ABBR_RE = re.compile(r"[A-Z]{2,4}")
 
+
+def _load_nba_team_index() -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Devuelve el índice abbr -> (id, displayName) vigente; si venció, un solo
+    hilo baja /teams y publica el índice nuevo. Propaga la excepción si ESPN falla (el índice anterior se conserva).
+    """
+    global _TEAM_INDEX, _team_index_expire_at
+
+    with _TEAM_INDEX_LOCK:
+        # Otro hilo pudo recargar mientras esperábamos el lock
+        index = _TEAM_INDEX
+        if index and time.monotonic() < _team_index_expire_at:
+            return index
+        index = _fetch_nba_team_index()
+        # Índice nuevo + vencimiento juntos: un lector concurrente nunca ve un
+        # índice vacío a medio recargar
+        _TEAM_INDEX = index
+        _team_index_expire_at = time.monotonic() + settings.espn_cache_ttl_seconds
+        return index
+
+
+def _fetch_nba_team_index() -> Dict[str, Tuple[str, Optional[str]]]:
+    """Baja /teams y arma un índice abbr -> (id, displayName) nuevo."""
+    teams_url = f"{BASE_URL_SITE}/teams"
+    logger.info("[ESPN][NBA] Fetch teams catalog: %s", teams_url)
+
+    teams_data = get_json_conditional(teams_url)
+
+    sports = teams_data.get("sports", [])
+    leagues = sports[0].get("leagues", []) if sports else []
+    teams = leagues[0].get("teams", []) if leagues else []
+
+    index: Dict[str, Tuple[str, Optional[str]]] = {}
+    for t in teams:
+        team_obj = (t or {}).get("team", {}) or {}
+        abbr = team_obj.get("abbreviation")
+        tid = team_obj.get("id")
+        if abbr and tid:
+            index[abbr] = (tid, team_obj.get("displayName"))
+    return index
+
+
+@single_flight
 def fetch_nba_team_roster_by_abbr(team_abbr: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Intenta obtener un roster simplificado NBA por abreviatura.
     ESPN NBA puede variar en el endpoint exacto dependiendo de la temporada.
     Esta versión:
-    - consulta teams desde site api
-    - busca el team_id por abbreviation
+    - resuelve el team_id con el índice cacheado del catálogo de teams
     - intenta pedir roster con un patrón común
 
     Si falla, regresa None sin romper el API.
     """
-    team_abbr = team_abbr.upper().strip()
+    team_abbr = (team_abbr or "").upper().strip()
+    if not _ABBR_RE.fullmatch(team_abbr):
+        # Basura / bots: se descarta antes de tocar ESPN
+        return None
+
     cache_key = f"nba:roster:{team_abbr}"
 
     if use_cache:
@@ -28,70 +85,53 @@ def fetch_nba_team_roster_by_abbr(team_abbr: str, use_cache: bool = True) -> Opt
             return cached
 
     try:
-        # 1) catálogo de equipos
-        teams_url = f"{BASE_URL_SITE}/teams"
-        logger.info(f"[ESPN][NBA] Fetch teams catalog: {teams_url}")
-
-        teams_resp = requests.get(teams_url, timeout=settings.espn_timeout_seconds)
-        teams_resp.raise_for_status()
-        teams_data = teams_resp.json()
-
-        sports = teams_data.get("sports", [])
-        leagues = sports[0].get("leagues", []) if sports else []
-        teams = leagues[0].get("teams", []) if leagues else []
-
-        team_id = None
-        team_name = None
+        # 1) team_id desde el índice del catálogo (se recarga solo al expirar)
+        index = _TEAM_INDEX
+        if not index or time.monotonic() >= _team_index_expire_at:
+            index = _load_nba_team_index()
 
-        for t in teams:
-            team_obj = (t or {}).get("team", {}) or {}
-            if team_obj.get("abbreviation") == team_abbr:
-                team_id = team_obj.get("id")
-                team_name = team_obj.get("displayName")
-                break
+        team_id, team_name = index.get(team_abbr, (None, None))
 
         if not team_id:
-            logger.warning(f"[ESPN][NBA] No se encontró team_id para {team_abbr}")
+            logger.warning("[ESPN][NBA] No se encontró team_id para %s", team_abbr)
             return None
 
         # 2) intentar roster
         # Patrón típico site api:
         roster_url = f"{BASE_URL_SITE}/teams/{team_id}/roster"
-        logger.info(f"[ESPN][NBA] Fetch roster: {roster_url}")
-
-        roster_resp = requests.get(roster_url, timeout=settings.espn_timeout_seconds)
-        roster_resp.raise_for_status()
-        roster_data = roster_resp.json()
-
-        players_out: List[Dict[str, Any]] = []
-
-        # ESPN suele traer "athletes" en grupos por posición
-        athletes_groups = roster_data.get("athletes", [])
-        for grp in athletes_groups:
-            items = grp.get("items", [])
-            for p in items:
-                players_out.append(
-                    {
-                        "athlete_id": str(p.get("id")) if p.get("id") else None,
-                        "name": p.get("fullName"),
-                        "position": (p.get("position") or {}).get("abbreviation"),
-                        "jersey": p.get("jersey"),
-                        "depth": None,
-                        "team_abbr": team_abbr,
-                    }
-                )
+        logger.info("[ESPN][NBA] Fetch roster: %s", roster_url)
+
+        roster_data = get_json(roster_url)
+
+        # ESPN suele traer "athletes" en grupos por posición. Una sola
+        # comprensión aplana los grupos y descarta los jugadores sin id.
+        players_out: List[Dict[str, Any]] = [
+            {
+                "athlete_id": str(athlete_id),
+                "name": p.get("fullName"),
+                "position": (p.get("position") or {}).get("abbreviation"),
+                "jersey": p.get("jersey"),
+                "depth": None,
+                "team_abbr": team_abbr,
+            }
+            for grp in roster_data.get("athletes", [])
+            for p in grp.get("items", [])
+            if (athlete_id := p.get("id"))
+        ]
 
         result = {
             "team_abbr": team_abbr,
             "team_name": team_name or team_abbr,
-            "players": [p for p in players_out if p.get("athlete_id")],
+            "players": players_out,
         }
 
         if use_cache:
-            set_in_cache(cache_key, result)
+            set_in_cache(
+                cache_key, result, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
 
         return result
 
     except Exception as e:
-        logger.error(f"[ESPN][NBA] Error roster {team_abbr}: {e}")
+        logger.error("[ESPN][NBA] Error roster %s: %s", team_abbr, e)
         return None
@@ -1,8 +1,8 @@
-import requests
 from typing import Optional, Dict, Any
 
 from app.config import settings
-from app.utils.cache import get_from_cache, set_in_cache
+from app.services.espn_http import ESPN_ERRORS, get_json
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
 # OJO: aquí usamos los nuevos nombres de config.py
@@ -10,6 +10,7 @@ BASE_URL_SITE = settings.espn_nfl_site_base_url
 BASE_URL_CORE = settings.espn_nfl_core_base_url
 
 
+@single_flight
 def fetch_scoreboard_data(week: int, season_type: int, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Obtiene el scoreboard NFL desde ESPN (no oficial).
@@ -20,27 +21,28 @@ def fetch_scoreboard_data(week: int, season_type: int, use_cache: bool = True) -
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NFL] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NFL] Cache HIT para %s", cache_key)
             return cached
 
     url = f"{BASE_URL_SITE}/scoreboard?seasontype={season_type}&week={week}"
-    logger.info(f"[ESPN][NFL] Fetch scoreboard desde URL: {url}")
+    logger.info("[ESPN][NFL] Fetch scoreboard desde URL: %s", url)
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NFL] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NFL] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NFL] Error al obtener el scoreboard: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NFL] Error al obtener el scoreboard: %s", e)
         return None
 
 
+@single_flight
 def fetch_game_odds(event_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Obtiene odds de un evento NFL por event_id.
@@ -51,22 +53,22 @@ def fetch_game_odds(event_id: str, use_cache: bool = True) -> Optional[Dict[str,
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NFL] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NFL] Cache HIT para %s", cache_key)
             return cached
 
     url = f"{BASE_URL_CORE}/events/{event_id}/competitions/{event_id}/odds"
-    logger.info(f"[ESPN][NFL] Fetch odds desde URL: {url}")
+    logger.info("[ESPN][NFL] Fetch odds desde URL: %s", url)
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NFL] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NFL] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NFL] Error al obtener las cuotas: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NFL] Error al obtener las cuotas: %s", e)
         return None
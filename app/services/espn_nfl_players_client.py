@@ -1,13 +1,14 @@
-import requests
 from typing import Optional, Dict, Any
 
 from app.config import settings
-from app.utils.cache import get_from_cache, set_in_cache
+from app.services.espn_http import ESPN_ERRORS, get_json
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
 BASE_URL_WEB = settings.espn_nfl_web_base_url
 
 
+@single_flight
 def fetch_player_gamelog(
     athlete_id: str,
     season: int,
@@ -30,22 +31,22 @@ def fetch_player_gamelog(
     if use_cache:
         cached = get_from_cache(cache_key, ttl_seconds=settings.espn_cache_ttl_seconds)
         if cached is not None:
-            logger.info(f"[ESPN][NFL][Gamelog] Cache HIT para {cache_key}")
+            logger.debug("[ESPN][NFL][Gamelog] Cache HIT para %s", cache_key)
             return cached
 
     url = f"{BASE_URL_WEB}/athletes/{athlete_id}/gamelog?season={season}&seasonType={season_type}"
-    logger.info(f"[ESPN][NFL][Gamelog] Fetch desde URL: {url}")
+    logger.info("[ESPN][NFL][Gamelog] Fetch desde URL: %s", url)
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][NFL][Gamelog] Cache SET para {cache_key}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][NFL][Gamelog] Cache SET para %s", cache_key)
 
         return data
-    except requests.RequestException as e:
-        logger.error(f"[ESPN][NFL][Gamelog] Error al obtener gamelog: {e}")
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][NFL][Gamelog] Error al obtener gamelog: %s", e)
         return None
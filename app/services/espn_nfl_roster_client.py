@@ -1,41 +1,60 @@
 # app/services/espn_nfl_roster_client.py
 
 import logging
+import re
+import threading
+import time
+from itertools import chain
 from typing import Dict, Any, List, Optional
 
-import requests
-
 from app.config import settings
+from app.services.espn_http import get_json, get_json_conditional
+from app.utils.parsing import to_int
 
 logger = logging.getLogger("wspm")
 
 # Usamos el SITE base de NFL
 BASE_URL_SITE = settings.espn_nfl_site_base_url
 
-# Cache en memoria para mapear abreviatura -> team_id
+# Cache en memoria para mapear abreviatura -> team_id. Se reconstruye
+# completo en cada recarga y se reasigna (nunca se vacía en sitio), así un
+# lector concurrente ve el catálogo viejo o el nuevo, no uno a medias.
 TEAM_ID_CACHE: Dict[str, int] = {}
-
-
-def _load_team_ids_from_espn() -> None:
+# Cache negativa: abreviaturas que ESPN no conoce. Va aparte para que una
+# recarga del catálogo no la borre; evita re-descargar el catálogo completo
+# por cada abreviatura mal escrita.
+_TEAM_ID_MISSES: Dict[str, None] = {}
+# Tope de entradas negativas para no crecer sin límite
+_TEAM_ID_CACHE_MAX = 256
+# Momento (monotonic) en que el catálogo cargado deja de ser válido
+# (0.0 = nunca se cargó)
+_team_ids_expire_at = 0.0
+# Serializa las recargas: con el catálogo vencido solo un hilo va a ESPN
+_TEAM_IDS_LOCK = threading.Lock()
+# Abreviaturas de equipo ESPN: 2-4 letras (KC, DAL, WSH)
+_ABBR_RE = re.compile(r"[A-Z]{2,4}")
+
+
+def _load_team_ids_from_espn() -> bool:
     """
     Llama a:
       https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams
 
-    y construye un mapa abbr -> team_id en TEAM_ID_CACHE.
+    y reconstruye el mapa abbr -> team_id en TEAM_ID_CACHE.
+    Devuelve False si ESPN falló (la cache anterior se conserva).
     """
-    global TEAM_ID_CACHE
+    global TEAM_ID_CACHE, _team_ids_expire_at
 
     url = f"{BASE_URL_SITE}/teams"
-    logger.info(f"[ESPN][NFL][Teams] Fetch lista de equipos desde: {url}")
+    logger.info("[ESPN][NFL][Teams] Fetch lista de equipos desde: %s", url)
 
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json_conditional(url)
     except Exception as e:
-        logger.error(f"[ESPN][NFL][Teams] Error al obtener lista de equipos: {e}")
-        return
+        logger.error("[ESPN][NFL][Teams] Error al obtener lista de equipos: %s", e)
+        return False
 
+    team_ids: Dict[str, int] = {}
     sports = data.get("sports") or []
     for s in sports:
         leagues = s.get("leagues") or []
@@ -45,30 +64,45 @@ def _load_team_ids_from_espn() -> None:
                 team_obj = t.get("team") or t
                 abbr = team_obj.get("abbreviation")
                 tid = team_obj.get("id")
-                if abbr and tid:
-                    try:
-                        tid_int = int(tid)
-                        TEAM_ID_CACHE[abbr.upper()] = tid_int
-                    except (TypeError, ValueError):
-                        continue
+                if abbr and (tid_int := to_int(tid)) is not None:
+                    team_ids[abbr.upper()] = tid_int
+
+    # Mapa nuevo + vencimiento juntos; las negativas que ahora sí existen se sueltan
+    TEAM_ID_CACHE = team_ids
+    _team_ids_expire_at = time.monotonic() + settings.espn_cache_ttl_seconds
+    for abbr in [a for a in _TEAM_ID_MISSES if a in team_ids]:
+        _TEAM_ID_MISSES.pop(abbr, None)
 
-    logger.info(f"[ESPN][NFL][Teams] Cargados {len(TEAM_ID_CACHE)} equipos en cache.")
+    logger.info("[ESPN][NFL][Teams] Cargados %d equipos en cache.", len(team_ids))
+    return True
 
 
 def get_team_id_from_abbr(team_abbr: str) -> Optional[int]:
     """
     Devuelve el team_id de ESPN para una abreviatura NFL (ej: DAL, KC, PHI).
-    Si la cache está vacía, primero llama a _load_team_ids_from_espn().
+    Solo recarga el catálogo (_load_team_ids_from_espn) si nunca se cargó o
+    ya expiró; con el catálogo vigente, una abreviatura desconocida se guarda
+    en la cache negativa y devuelve None sin volver a ESPN.
     """
-    if not team_abbr:
+    abbr_up = (team_abbr or "").upper().strip()
+    if not _ABBR_RE.fullmatch(abbr_up):
+        # Basura / bots: ni siquiera vale la pena mirar el catálogo
+        return None
+    if abbr_up in _TEAM_ID_MISSES:
+        # Ya sabemos que ESPN no la conoce: no dispara una recarga del catálogo
         return None
 
-    abbr_up = team_abbr.upper()
-
-    if abbr_up not in TEAM_ID_CACHE:
-        _load_team_ids_from_espn()
+    if time.monotonic() >= _team_ids_expire_at:
+        with _TEAM_IDS_LOCK:
+            # Otro hilo pudo recargar mientras esperábamos el lock
+            if time.monotonic() >= _team_ids_expire_at and not _load_team_ids_from_espn():
+                # ESPN caído: usamos lo que hubiera en cache, sin cachear el fallo
+                return TEAM_ID_CACHE.get(abbr_up)
 
-    return TEAM_ID_CACHE.get(abbr_up)
+    tid = TEAM_ID_CACHE.get(abbr_up)
+    if tid is None and abbr_up not in _TEAM_ID_MISSES and len(_TEAM_ID_MISSES) < _TEAM_ID_CACHE_MAX:
+        _TEAM_ID_MISSES[abbr_up] = None
+    return tid
 
 
 def fetch_team_roster(team_id: int) -> Optional[Dict[str, Any]]:
@@ -78,15 +112,12 @@ def fetch_team_roster(team_id: int) -> Optional[Dict[str, Any]]:
       https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams/{TEAM_ID}/roster
     """
     url = f"{BASE_URL_SITE}/teams/{team_id}/roster"
-    logger.info(f"[ESPN][NFL][Roster] Fetch desde URL: {url}")
+    logger.info("[ESPN][NFL][Roster] Fetch desde URL: %s", url)
 
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        return data
+        return get_json(url)
     except Exception as e:
-        logger.error(f"[ESPN][NFL][Roster] Error al obtener roster para team_id={team_id}: {e}")
+        logger.error("[ESPN][NFL][Roster] Error al obtener roster para team_id=%s: %s", team_id, e)
         return None
 
 
@@ -94,50 +125,30 @@ def _parse_athletes_list(athletes: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     """
     Parsea una lista de atletas (ya "aplanada") en formato simplificado.
     Cada elemento de `athletes` aquí debe ser un objeto jugador.
-    """
-    players_out: List[Dict[str, Any]] = []
-
-    for item in athletes:
-        # Algunos endpoints usan directamente el atleta;
-        # otros usan { "athlete": { ... }, "position": {...}, ... }
-        athlete = item.get("athlete") or item.get("player") or item
-        athlete_id = athlete.get("id")
-        if not athlete_id:
-            continue
-
-        full_name = (
-            athlete.get("fullName")
-            or athlete.get("displayName")
-            or athlete.get("shortName")
-            or ""
-        )
-
-        # Posición: primero del "item", luego del propio athlete
-        pos_obj = item.get("position") or athlete.get("position") or {}
-        position = pos_obj.get("abbreviation") or pos_obj.get("displayName")
-
-        jersey = athlete.get("jersey") or item.get("jersey")
-
-        depth = item.get("depthChartOrder") or item.get("starter")
-        try:
-            if isinstance(depth, str):
-                depth_int = int(depth)
-            else:
-                depth_int = int(depth) if depth is not None else None
-        except (TypeError, ValueError):
-            depth_int = None
-
-        players_out.append(
-            {
-                "athlete_id": str(athlete_id),
-                "name": full_name,
-                "position": position,
-                "jersey": jersey,
-                "depth": depth_int,
-            }
-        )
 
-    return players_out
+    Algunos endpoints usan directamente el atleta; otros usan
+    { "athlete": { ... }, "position": {...}, ... }. La posición se toma
+    primero del "item" y luego del propio athlete.
+    """
+    return [
+        {
+            "athlete_id": str(athlete_id),
+            "name": (
+                athlete.get("fullName")
+                or athlete.get("displayName")
+                or athlete.get("shortName")
+                or ""
+            ),
+            "position": (
+                (pos_obj := item.get("position") or athlete.get("position") or {}).get("abbreviation")
+                or pos_obj.get("displayName")
+            ),
+            "jersey": athlete.get("jersey") or item.get("jersey"),
+            "depth": to_int(item.get("depthChartOrder") or item.get("starter")),
+        }
+        for item in athletes
+        if (athlete_id := (athlete := item.get("athlete") or item.get("player") or item).get("id"))
+    ]
 
 
 def parse_team_roster(raw: Dict[str, Any], team_abbr: str) -> Dict[str, Any]:
@@ -167,14 +178,18 @@ def parse_team_roster(raw: Dict[str, Any], team_abbr: str) -> Dict[str, Any]:
     #   ...
     # ]
     # Tenemos que *aplanar* todos los items de todos los grupos.
-    athletes_list: List[Dict[str, Any]] = []
-
     groups = raw.get("athletes") or []
-    if isinstance(groups, list):
-        for group in groups:
-            items = group.get("items") or []
-            if isinstance(items, list):
-                athletes_list.extend(items)
+    athletes_list: List[Dict[str, Any]] = (
+        list(
+            chain.from_iterable(
+                g["items"]
+                for g in groups
+                if isinstance(g, dict) and isinstance(g.get("items"), list)
+            )
+        )
+        if isinstance(groups, list)
+        else []
+    )
 
     # Fallback defensivo por si ESPN cambia algo
     if not athletes_list:
@@ -204,7 +219,7 @@ def fetch_team_roster_by_abbr(team_abbr: str) -> Optional[Dict[str, Any]]:
     """
     team_id = get_team_id_from_abbr(team_abbr)
     if team_id is None:
-        logger.warning(f"[ESPN][NFL][Roster] No se encontró team_id para abreviatura={team_abbr}")
+        logger.warning("[ESPN][NFL][Roster] No se encontró team_id para abreviatura=%s", team_abbr)
         return None
 
     raw = fetch_team_roster(team_id)
@@ -3,9 +3,9 @@
 import logging
 from typing import List, Dict, Any, Optional
 
-import requests
-
 from app.config import settings
+from app.services.espn_http import get_json_conditional
+from app.utils.parsing import to_int
 
 logger = logging.getLogger("wspm")
 
@@ -19,14 +19,12 @@ def fetch_nfl_teams_raw() -> Optional[Dict[str, Any]]:
       https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams
     """
     url = f"{BASE_URL_SITE}/teams"
-    logger.info(f"[ESPN][NFL][Teams] Fetch lista de equipos desde: {url}")
+    logger.info("[ESPN][NFL][Teams] Fetch lista de equipos desde: %s", url)
 
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
+        return get_json_conditional(url)
     except Exception as e:
-        logger.error(f"[ESPN][NFL][Teams] Error al obtener lista de equipos: {e}")
+        logger.error("[ESPN][NFL][Teams] Error al obtener lista de equipos: %s", e)
         return None
 
 
@@ -72,9 +70,8 @@ def parse_nfl_teams(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
                 if not tid or not abbr or not name:
                     continue
 
-                try:
-                    team_id = int(tid)
-                except (TypeError, ValueError):
+                team_id = to_int(tid)
+                if team_id is None:
                     continue
 
                 teams_out.append(
@@ -1,14 +1,19 @@
 # app/services/espn_soccer_client.py
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
-import requests
-
 from app.config import settings
-from app.utils.cache import get_from_cache, set_in_cache
+from app.services.espn_http import ESPN_ERRORS, get_json
+from app.utils.cache import get_from_cache, jittered_ttl, set_in_cache, single_flight
 from app.core.logging import logger
 
+# Resueltos una sola vez al importar (settings no cambia en runtime)
+_SOCCER_ALIASES = dict(settings.espn_soccer_leagues)
+_SOCCER_CODES = frozenset(_SOCCER_ALIASES.values())
+
 
+@lru_cache(maxsize=128)
 def _resolve_league_code(raw_league: Optional[str]) -> str:
     """
     Normaliza el parámetro de liga para usarlo en las URLs de ESPN.
@@ -17,6 +22,9 @@ def _resolve_league_code(raw_league: Optional[str]) -> str:
       - None -> usa liga por defecto (settings.espn_soccer_default_league)
       - alias definido en settings.espn_soccer_leagues (ej. "laliga")
       - código ESPN directo (ej. "esp.1", "eng.1")
+
+    Es una función pura de settings (que no cambia en runtime), así que se
+    memoiza: cada liga se resuelve una sola vez.
     """
     if not raw_league:
         return settings.espn_soccer_default_league
@@ -24,17 +32,15 @@ def _resolve_league_code(raw_league: Optional[str]) -> str:
     league = raw_league.strip()
 
     # 1) Si viene ya un código ESPN válido (ej: "esp.1") lo aceptamos tal cual
-    if league in settings.espn_soccer_leagues.values():
+    if league in _SOCCER_CODES:
         return league
 
-    # 2) Si viene un alias (ej: "laliga", "premier_league")
-    if league in settings.espn_soccer_leagues:
-        return settings.espn_soccer_leagues[league]
-
-    # 3) Fallback: usar lo que venga (permite probar ligas no mapeadas aún)
-    return league
+    # 2) Alias (ej: "laliga", "premier_league") o 3) fallback: usar lo que
+    # venga (permite probar ligas no mapeadas aún)
+    return _SOCCER_ALIASES.get(league, league)
 
 
+@lru_cache(maxsize=64)
 def _build_site_base_url(league_code: str) -> str:
     """
     Construye el base_url 'site' para una liga dada (scoreboard).
@@ -44,6 +50,7 @@ def _build_site_base_url(league_code: str) -> str:
     )
 
 
+@lru_cache(maxsize=64)
 def _build_core_base_url(league_code: str) -> str:
     """
     Construye el base_url 'core' para una liga dada (odds).
@@ -53,6 +60,7 @@ def _build_core_base_url(league_code: str) -> str:
     )
 
 
+@single_flight
 def fetch_soccer_scoreboard_data(
     league: Optional[str] = None,
     use_cache: bool = True,
@@ -73,34 +81,30 @@ def fetch_soccer_scoreboard_data(
             ttl_seconds=settings.espn_cache_ttl_seconds,
         )
         if cached is not None:
-            logger.info(f"[ESPN][SOCCER] Cache HIT scoreboard {league_code}")
+            logger.debug("[ESPN][SOCCER] Cache HIT scoreboard %s", league_code)
             return cached
 
     base_url = _build_site_base_url(league_code)
     url = f"{base_url}/scoreboard"
 
-    logger.info(f"[ESPN][SOCCER] Fetch scoreboard {league_code} URL={url}")
+    logger.info("[ESPN][SOCCER] Fetch scoreboard %s URL=%s", league_code, url)
 
     try:
-        resp = requests.get(
-            url,
-            timeout=settings.espn_timeout_seconds,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(f"[ESPN][SOCCER] Cache SET scoreboard {league_code}")
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
+            )
+            logger.info("[ESPN][SOCCER] Cache SET scoreboard %s", league_code)
 
         return data
-    except requests.RequestException as e:
-        logger.error(
-            f"[ESPN][SOCCER] Error al obtener scoreboard {league_code}: {e}"
-        )
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][SOCCER] Error al obtener scoreboard %s: %s", league_code, e)
         return None
 
 
+@single_flight
 def fetch_soccer_game_odds(
     event_id: str,
     league: Optional[str] = None,
@@ -118,33 +122,24 @@ def fetch_soccer_game_odds(
             ttl_seconds=settings.espn_cache_ttl_seconds,
         )
         if cached is not None:
-            logger.info(f"[ESPN][SOCCER] Cache HIT odds {league_code} ev={event_id}")
+            logger.debug("[ESPN][SOCCER] Cache HIT odds %s ev=%s", league_code, event_id)
             return cached
 
     core_base = _build_core_base_url(league_code)
     url = f"{core_base}/events/{event_id}/competitions/{event_id}/odds"
 
-    logger.info(
-        f"[ESPN][SOCCER] Fetch odds {league_code} ev={event_id} URL={url}"
-    )
+    logger.info("[ESPN][SOCCER] Fetch odds %s ev=%s URL=%s", league_code, event_id, url)
 
     try:
-        resp = requests.get(
-            url,
-            timeout=settings.espn_timeout_seconds,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = get_json(url)
 
         if use_cache:
-            set_in_cache(cache_key, data)
-            logger.info(
-                f"[ESPN][SOCCER] Cache SET odds {league_code} ev={event_id}"
+            set_in_cache(
+                cache_key, data, ttl_seconds=jittered_ttl(settings.espn_cache_ttl_seconds)
             )
+            logger.info("[ESPN][SOCCER] Cache SET odds %s ev=%s", league_code, event_id)
 
         return data
-    except requests.RequestException as e:
-        logger.error(
-            f"[ESPN][SOCCER] Error al obtener odds {league_code} ev={event_id}: {e}"
-        )
+    except ESPN_ERRORS as e:
+        logger.error("[ESPN][SOCCER] Error al obtener odds %s ev=%s: %s", league_code, event_id, e)
         return None
@@ -1,77 +1,171 @@
 # app/services/nfl_game_projection.py
 
-from typing import Dict, Any, Tuple, List
+import math
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Tuple, List, Optional
 
 from app.services.espn_nfl_client import fetch_scoreboard_data
 
+# Pool compartido para adelantar la descarga del scoreboard de la semana
+# anterior mientras se procesa la actual (un prefetch por proyección en curso).
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nfl-prefetch")
 
-def _collect_recent_team_points(
-    team_abbr: str,
-    current_week: int,
-    season_type: int,
-    games_window: int = 5,
-) -> Tuple[float, float]:
+# Cortes de safety % (ascendentes) -> etiqueta / probabilidad aproximada.
+# bisect_right(cortes, pct) da el tramo: pct >= corte cae en el tramo superior.
+_CONF_THRESH = (5, 10, 15)
+_CONF_LABELS = ("Baja", "Media", "Media-Alta", "Alta")
+
+# Misma lógica que WSPM de jugadores
+_PROB_THRESH = (2, 5, 10, 15)
+_PROB_VALUES = (52.0, 55.0, 60.0, 65.0, 70.0)
+
+
+def _band(cuts: Tuple[float, ...], pct: float) -> int:
+    # NaN/inf (ej. book_total "nan") cae al tramo más bajo, como la escalera
+    # de `>=` original; bisect sin este corte lo mandaría al más alto.
+    if not math.isfinite(pct):
+        return 0
+    return bisect_right(cuts, pct)
+
+
+def _conf(pct: float) -> str:
+    return _CONF_LABELS[_band(_CONF_THRESH, pct)]
+
+
+def _prob_from_safety(pct: float) -> float:
+    return _PROB_VALUES[_band(_PROB_THRESH, pct)]
+
+
+def _avg(values: List[float]) -> float:
+    return float(sum(values) / len(values)) if values else 0.0
+
+
+# (semana, season_type) -> (scoreboard, índice). Se guarda el scoreboard para
+# detectar cuándo la caché TTL trajo uno nuevo y hay que reindexar.
+_SCOREBOARD_INDEX: Dict[Tuple[int, int], Tuple[Any, Dict[str, List[Tuple[float, float]]]]] = {}
+
+
+def _index_scoreboard(sb: Dict[str, Any]) -> Dict[str, List[Tuple[float, float]]]:
     """
-    Recolecta puntos a favor y en contra recientes para un equipo usando el scoreboard de ESPN.
-    Busca hacia atrás desde current_week-1 hasta la 1.
+    Recorre los eventos finalizados una sola vez y arma
+    abbr -> [(puntos a favor, puntos en contra), ...] en el orden del scoreboard.
     """
+    index: Dict[str, List[Tuple[float, float]]] = {}
+    if not sb:
+        return index
 
-    points_for: List[float] = []
-    points_against: List[float] = []
+    for ev in sb.get("events", []) or []:
+        competitions = ev.get("competitions", [])
+        if not competitions:
+            continue
+        comp = competitions[0]
+        competitors = comp.get("competitors", [])
+        if len(competitors) < 2:
+            continue
 
-    # Recorremos semanas hacia atrás
-    for wk in range(current_week - 1, 0, -1):
-        sb = fetch_scoreboard_data(wk, season_type)
-        if not sb or "events" not in sb:
+        # Solo partidos finalizados
+        status_type = (comp.get("status") or {}).get("type") or {}
+        if not status_type.get("completed", False):
             continue
 
-        for ev in sb.get("events", []):
-            competitions = ev.get("competitions", [])
-            if not competitions:
+        home = competitors[0]
+        away = competitors[1]
+
+        for side, other in ((home, away), (away, home)):
+            team = side.get("team", {}) or {}
+            abbr = team.get("abbreviation")
+            if not abbr:
                 continue
-            comp = competitions[0]
-            competitors = comp.get("competitors", [])
-            if len(competitors) < 2:
+            try:
+                pf = float(side.get("score", 0))
+                pa = float(other.get("score", 0))
+            except (TypeError, ValueError):
                 continue
+            index.setdefault(abbr, []).append((pf, pa))
 
-            # Solo partidos finalizados
-            status_type = (comp.get("status") or {}).get("type") or {}
-            if not status_type.get("completed", False):
-                continue
+    return index
 
-            home = competitors[0]
-            away = competitors[1]
-
-            for side in (home, away):
-                team = side.get("team", {}) or {}
-                abbr = team.get("abbreviation")
-                if abbr != team_abbr:
-                    continue
-
-                # Rival
-                other = away if side is home else home
-                try:
-                    pf = float(side.get("score", 0))
-                    pa = float(other.get("score", 0))
-                except (TypeError, ValueError):
-                    continue
-
-                points_for.append(pf)
-                points_against.append(pa)
-                break
 
-            if len(points_for) >= games_window:
-                break
+def _scoreboard_index(
+    week: int,
+    season_type: int,
+    sb: Dict[str, Any],
+) -> Dict[str, List[Tuple[float, float]]]:
+    """Índice de _index_scoreboard, calculado una vez por scoreboard descargado."""
+    key = (week, season_type)
+    cached = _SCOREBOARD_INDEX.get(key)
+    if cached is not None and cached[0] is sb:
+        return cached[1]
+
+    index = _index_scoreboard(sb)
+    _SCOREBOARD_INDEX[key] = (sb, index)
+    return index
+
+
+def _collect_recent_team_points_pair(
+    home_abbr: str,
+    away_abbr: str,
+    current_week: int,
+    season_type: int,
+    games_window: int = 5,
+) -> Tuple[float, float, float, float]:
+    """
+    Recolecta puntos a favor y en contra recientes de ambos equipos usando el
+    scoreboard de ESPN, en una sola pasada por semana.
+    Busca hacia atrás desde current_week-1 hasta la 1.
 
-        if len(points_for) >= games_window:
-            break
+    Devuelve (home_pf, home_pa, away_pf, away_pa) como promedios.
+    """
 
-    if not points_for:
-        return 0.0, 0.0
+    # abbr -> (puntos a favor, puntos en contra)
+    points: Dict[str, Tuple[List[float], List[float]]] = {
+        home_abbr: ([], []),
+        away_abbr: ([], []),
+    }
 
-    avg_pf = sum(points_for) / len(points_for)
-    avg_pa = sum(points_against) / len(points_against) if points_against else 0.0
-    return float(avg_pf), float(avg_pa)
+    def _done() -> bool:
+        return all(len(pf) >= games_window for pf, _ in points.values())
+
+    def _may_finish_this_week() -> bool:
+        # Un equipo NFL juega a lo sumo un partido por semana
+        return all(len(pf) >= games_window - 1 for pf, _ in points.values())
+
+    # Mientras se analizan los eventos de una semana, la anterior ya se
+    # está descargando en segundo plano. Solo se adelanta si seguro hará
+    # falta: si esta semana puede completar ambas ventanas, se espera a
+    # procesarla para no pedirle a ESPN una semana que luego se descarta.
+    prefetch: Optional[Future] = None
+    try:
+        # Recorremos semanas hacia atrás
+        for wk in range(current_week - 1, 0, -1):
+            if prefetch is not None:
+                sb = prefetch.result()
+            else:
+                sb = fetch_scoreboard_data(wk, season_type)
+
+            prefetch = None
+            if wk > 1 and not _may_finish_this_week():
+                prefetch = _PREFETCH_POOL.submit(fetch_scoreboard_data, wk - 1, season_type)
+
+            index = _scoreboard_index(wk, season_type, sb)
+            for abbr, (pf_list, pa_list) in points.items():
+                for pf, pa in index.get(abbr, ()):
+                    if len(pf_list) >= games_window:
+                        break
+                    pf_list.append(pf)
+                    pa_list.append(pa)
+
+            if _done():
+                break
+    finally:
+        # Si algo falló a mitad del recorrido no se deja un prefetch en cola
+        if prefetch is not None:
+            prefetch.cancel()
+
+    home_pf, home_pa = points[home_abbr]
+    away_pf, away_pa = points[away_abbr]
+    return _avg(home_pf), _avg(home_pa), _avg(away_pf), _avg(away_pa)
 
 
 def compute_game_projection(
@@ -124,16 +218,15 @@ def compute_game_projection(
             home_team = info
         elif side == "away":
             away_team = info
+        if home_team and away_team:
+            break
 
     if not home_team or not away_team:
         raise ValueError("No fue posible identificar home/away en el evento.")
 
-    # Medias recientes de puntos anotados / permitidos
-    home_pf, home_pa = _collect_recent_team_points(
-        home_team["abbr"], week, season_type, games_window
-    )
-    away_pf, away_pa = _collect_recent_team_points(
-        away_team["abbr"], week, season_type, games_window
+    # Medias recientes de puntos anotados / permitidos (una sola pasada)
+    home_pf, home_pa, away_pf, away_pa = _collect_recent_team_points_pair(
+        home_team["abbr"], away_team["abbr"], week, season_type, games_window
     )
 
     # Si no tenemos historial, devolvemos algo trivial basado en el book
@@ -176,29 +269,6 @@ def compute_game_projection(
     safety_spread = abs(edge_spread)
     safety_spread_pct = abs(margin_spread_pct)
 
-    def _conf(pct: float) -> str:
-        if pct >= 15:
-            return "Alta"
-        elif pct >= 10:
-            return "Media-Alta"
-        elif pct >= 5:
-            return "Media"
-        else:
-            return "Baja"
-
-    # Probabilidades aproximadas (misma lógica que WSPM de jugadores)
-    def _prob_from_safety(pct: float) -> float:
-        if pct >= 15:
-            return 70.0
-        elif pct >= 10:
-            return 65.0
-        elif pct >= 5:
-            return 60.0
-        elif pct >= 2:
-            return 55.0
-        else:
-            return 52.0
-
     prob_total = _prob_from_safety(safety_total_pct)
     prob_spread = _prob_from_safety(safety_spread_pct)
 
@@ -1,9 +1,23 @@
 # app/services/soccer_game_projection.py
 
-from typing import Any, Dict, Optional, Tuple
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.schemas.nfl import TeamInfo
 
+# Etiquetas de confianza por tramo; cada mercado define sus cortes ascendentes
+# y bisect_right(cortes, valor) da el índice (valor >= corte sube de tramo).
+_CONF_LABELS = ("Baja", "Media", "Media-Alta", "Alta")
+_EDGE_CUTS = (2, 5, 10)
+_EDGE_PROBS = (0.53, 0.56, 0.60, 0.65)
+_BTTS_CUTS = (3, 7, 12)
+_1X2_CUTS = (4, 8, 12)
+_DC_CUTS = (5, 10, 15)
+
+# Picks 1X2 y su doble oportunidad, en el orden de (home, draw, away)
+_1X2_PICKS = ("1", "X", "2")
+_DC_PICKS = ("1X", "12", "X2")
+
 
 def _safe_float(value: Any) -> Optional[float]:
     try:
@@ -14,26 +28,31 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-def _get_team_info_from_event(event: Dict[str, Any]) -> Tuple[Optional[TeamInfo], Optional[TeamInfo]]:
-    comp = (event.get("competitions") or [{}])[0]
-    competitors = comp.get("competitors") or []
-
-    home_team: Optional[TeamInfo] = None
-    away_team: Optional[TeamInfo] = None
-
+def _split_home_away(
+    competitors: List[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Separa home / away en una sola pasada, cortando al encontrar ambos."""
+    home: Optional[Dict[str, Any]] = None
+    away: Optional[Dict[str, Any]] = None
     for c in competitors:
         side = c.get("homeAway")
-        team = c.get("team") or {}
-        info = TeamInfo(
-            name=team.get("displayName") or team.get("name"),
-            abbr=team.get("abbreviation"),
-        )
-        if side == "home":
-            home_team = info
-        elif side == "away":
-            away_team = info
+        if side == "home" and home is None:
+            home = c
+        elif side == "away" and away is None:
+            away = c
+        if home is not None and away is not None:
+            break
+    return home, away
+
 
-    return home_team, away_team
+def _team_info(competitor: Optional[Dict[str, Any]]) -> Optional[TeamInfo]:
+    if competitor is None:
+        return None
+    team = competitor.get("team") or {}
+    return TeamInfo(
+        name=team.get("displayName") or team.get("name"),
+        abbr=team.get("abbreviation"),
+    )
 
 
 def _form_score(competitor: Dict[str, Any]) -> float:
@@ -54,28 +73,16 @@ def _form_score(competitor: Dict[str, Any]) -> float:
     if not form_str or not isinstance(form_str, str):
         return 0.0
 
-    score = 0.0
-    for ch in form_str:
-        u = ch.upper()
-        if u == "W":
-            score += 1.0
-        elif u == "D":
-            score += 0.4
-        elif u == "L":
-            score -= 1.0
+    # Un solo upper() y tres count() en C en lugar de iterar carácter a carácter
+    u = form_str.upper()
+    score = u.count("W") * 1.0 + u.count("D") * 0.4 - u.count("L") * 1.0
 
     return score
 
 
 def _edge_to_prob_and_conf(edge_pct: float) -> Tuple[float, str]:
-    abs_edge = abs(edge_pct)
-    if abs_edge < 2:
-        return 0.53, "Baja"
-    if abs_edge < 5:
-        return 0.56, "Media"
-    if abs_edge < 10:
-        return 0.60, "Media-Alta"
-    return 0.65, "Alta"
+    i = bisect_right(_EDGE_CUTS, abs(edge_pct))
+    return _EDGE_PROBS[i], _CONF_LABELS[i]
 
 
 def compute_soccer_game_projection(
@@ -94,13 +101,13 @@ def compute_soccer_game_projection(
         * 1X2 (1, X, 2)
         * Doble oportunidad (1X, X2, 12)
     """
-    home_team, away_team = _get_team_info_from_event(event)
-
     comp = (event.get("competitions") or [{}])[0]
-    competitors = comp.get("competitors") or []
+    home_comp, away_comp = _split_home_away(comp.get("competitors") or [])
 
-    home_comp = next((c for c in competitors if c.get("homeAway") == "home"), {})
-    away_comp = next((c for c in competitors if c.get("homeAway") == "away"), {})
+    home_team = _team_info(home_comp)
+    away_team = _team_info(away_comp)
+    home_comp = home_comp or {}
+    away_comp = away_comp or {}
 
     home_form = _form_score(home_comp)
     away_form = _form_score(away_comp)
@@ -149,14 +156,7 @@ def compute_soccer_game_projection(
     pick_btts = "YES" if base_btts_prob >= 0.53 else "NO"
 
     diff_btts_pct = abs(base_btts_prob - 0.5) * 100.0
-    if diff_btts_pct < 3:
-        conf_btts = "Baja"
-    elif diff_btts_pct < 7:
-        conf_btts = "Media"
-    elif diff_btts_pct < 12:
-        conf_btts = "Media-Alta"
-    else:
-        conf_btts = "Alta"
+    conf_btts = _CONF_LABELS[bisect_right(_BTTS_CUTS, diff_btts_pct)]
 
     # ----------------- 1X2 -----------------
     # Usamos el handicap como proxy de fuerza local/visita.
@@ -169,46 +169,29 @@ def compute_soccer_game_projection(
     remaining = 1.0 - (prob_home + prob_away)
     prob_draw = max(0.15, remaining)
 
-    s = prob_home + prob_away + prob_draw
-    prob_home /= s
-    prob_away /= s
-    prob_draw /= s
+    inv = 1.0 / (prob_home + prob_away + prob_draw)
+    probs = (prob_home * inv, prob_draw * inv, prob_away * inv)
+    prob_home, prob_draw, prob_away = probs
 
-    probs = {"1": prob_home, "X": prob_draw, "2": prob_away}
-    pick_1x2 = max(probs.items(), key=lambda kv: kv[1])[0]
-    prob_1x2 = probs[pick_1x2]
+    # Índice del máximo (en empate gana el primero: 1, X, 2)
+    pick_idx = max(range(3), key=probs.__getitem__)
+    pick_1x2 = _1X2_PICKS[pick_idx]
+    prob_1x2 = probs[pick_idx]
 
-    sorted_probs = sorted(probs.values(), reverse=True)
+    sorted_probs = sorted(probs, reverse=True)
     gap = (sorted_probs[0] - sorted_probs[1]) * 100.0
-    if gap < 4:
-        conf_1x2 = "Baja"
-    elif gap < 8:
-        conf_1x2 = "Media"
-    elif gap < 12:
-        conf_1x2 = "Media-Alta"
-    else:
-        conf_1x2 = "Alta"
+    conf_1x2 = _CONF_LABELS[bisect_right(_1X2_CUTS, gap)]
 
     # ----------------- Doble oportunidad -----------------
-    if pick_1x2 == "1":
-        pick_dc = "1X"
-        prob_dc = prob_home + prob_draw
-    elif pick_1x2 == "2":
-        pick_dc = "X2"
-        prob_dc = prob_away + prob_draw
-    else:
-        pick_dc = "12"
+    # El pick suma su probabilidad con la del empate (o 1+2 si el pick es X)
+    pick_dc = _DC_PICKS[pick_idx]
+    if pick_idx == 1:
         prob_dc = prob_home + prob_away
+    else:
+        prob_dc = prob_1x2 + prob_draw
 
     diff_dc_pct = (prob_dc - 0.5) * 100.0
-    if diff_dc_pct < 5:
-        conf_dc = "Baja"
-    elif diff_dc_pct < 10:
-        conf_dc = "Media"
-    elif diff_dc_pct < 15:
-        conf_dc = "Media-Alta"
-    else:
-        conf_dc = "Alta"
+    conf_dc = _CONF_LABELS[bisect_right(_DC_CUTS, diff_dc_pct)]
 
     return {
         "event_id": str(event.get("id")),
@@ -1,4 +1,25 @@
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.parsing import to_float
+
+MARKET_ALIASES: Dict[str, List[str]] = {
+    "points": ["points", "pts"],
+    "rebounds": ["rebounds", "reb", "totalRebounds"],
+    "assists": ["assists", "ast"],
+    "threes_made": [
+        "threePointFieldGoalsMade",
+        "threePointFGM",
+        "3ptFieldGoalsMade",
+        "3ptfgm",
+        "fg3m",
+    ],
+}
+
+# Mismos alias ya en minúsculas (se calculan una sola vez al importar)
+_MARKET_ALIASES_LOWER: Dict[str, Tuple[str, ...]] = {
+    k: tuple(a.lower() for a in v) for k, v in MARKET_ALIASES.items()
+}
 
 
 def _find_stat_index(names: List[str], aliases: List[str]) -> Optional[int]:
@@ -6,21 +27,40 @@ def _find_stat_index(names: List[str], aliases: List[str]) -> Optional[int]:
         return None
 
     lowered = [n.lower() for n in names]
+    aliases_l = [a.lower() for a in aliases]
 
-    for a in aliases:
-        a_l = a.lower()
-        if a_l in lowered:
-            return lowered.index(a_l)
+    # nombre -> primer índice en que aparece
+    name_to_idx: Dict[str, int] = {}
+    for i, n in enumerate(lowered):
+        name_to_idx.setdefault(n, i)
+
+    for a_l in aliases_l:
+        idx = name_to_idx.get(a_l)
+        if idx is not None:
+            return idx
 
     # fallback: match parcial
     for i, n in enumerate(lowered):
-        for a in aliases:
-            if a.lower() in n:
+        for a_l in aliases_l:
+            if a_l in n:
                 return i
 
     return None
 
 
+@lru_cache(maxsize=64)
+def _market_stat_index(names: Tuple[str, ...], market_type: str) -> Optional[int]:
+    """
+    Índice de la columna de `market_type` para un juego de cabeceras.
+    ESPN repite las mismas `names` en todos los gamelogs, así que la búsqueda
+    por alias se resuelve una vez y luego es un hit de lru_cache.
+    """
+    aliases = _MARKET_ALIASES_LOWER.get(market_type)
+    if not aliases:
+        return None
+    return _find_stat_index(list(names), list(aliases))
+
+
 def _extract_regular_season_events(gamelog: Dict[str, Any]) -> List[Dict[str, Any]]:
     season_types = gamelog.get("seasonTypes", [])
     for st in season_types:
@@ -59,28 +99,16 @@ def compute_base_projection_from_gamelog(
     - threes_made
     """
 
-    if not gamelog or not isinstance(gamelog, Dict):
+    if not gamelog or not isinstance(gamelog, dict):
         return 0.0
 
-    market_aliases = {
-        "points": ["points", "pts"],
-        "rebounds": ["rebounds", "reb", "totalRebounds"],
-        "assists": ["assists", "ast"],
-        "threes_made": [
-            "threePointFieldGoalsMade",
-            "threePointFGM",
-            "3ptFieldGoalsMade",
-            "3ptfgm",
-            "fg3m",
-        ],
-    }
-
-    aliases = market_aliases.get(market_type)
-    if not aliases:
+    if market_type not in MARKET_ALIASES:
         return 0.0
 
     stat_names_list: List[str] = gamelog.get("names", [])
-    stat_idx = _find_stat_index(stat_names_list, aliases)
+    if not isinstance(stat_names_list, list):
+        return 0.0
+    stat_idx = _market_stat_index(tuple(stat_names_list), market_type)
     if stat_idx is None:
         return 0.0
 
@@ -97,12 +125,10 @@ def compute_base_projection_from_gamelog(
             continue
 
         if len(stats_array) > stat_idx:
-            raw = stats_array[stat_idx]
-            try:
-                val = float(str(raw).replace(",", ""))
-                values.append(val)
-            except (TypeError, ValueError):
+            val = to_float(stats_array[stat_idx])
+            if val is None:
                 continue
+            values.append(val)
 
         if len(values) >= games_window:
             break
@@ -1,11 +1,26 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.services.espn_nba_client import fetch_nba_scoreboard
 from app.services.espn_nba_roster_client import fetch_nba_team_roster_by_abbr
 from app.services.espn_nba_players_client import fetch_nba_player_gamelog
-from app.services.wspm_nba_engine import _find_stat_index, _extract_regular_season_events
+from app.services.wspm_nba_engine import (
+    MARKET_ALIASES,
+    _extract_regular_season_events,
+    _market_stat_index,
+)
+from app.utils.parsing import to_float
 
 
+# Hilos para solapar los round-trips a ESPN (rosters y gamelogs son I/O puro)
+_MAX_WORKERS = 16
+
+# Largo mínimo de racha para aparecer en el reporte
+_MIN_STREAK = 5
+
+_BY_STREAK = itemgetter("streak")
+
 DEFAULT_THRESHOLDS = {
     "points": [23, 18, 16, 15, 14, 13, 12, 11],
     "rebounds": [7, 5, 4],
@@ -13,18 +28,8 @@ DEFAULT_THRESHOLDS = {
     "threes_made": [1],
 }
 
-ALIASES = {
-    "points": ["points", "pts"],
-    "rebounds": ["rebounds", "reb", "totalRebounds"],
-    "assists": ["assists", "ast"],
-    "threes_made": [
-        "threePointFieldGoalsMade",
-        "threePointFGM",
-        "3ptFieldGoalsMade",
-        "3ptfgm",
-        "fg3m",
-    ],
-}
+# Alias de columnas por stat (compartidos con el motor de proyección)
+ALIASES = MARKET_ALIASES
 
 
 def _compute_streak(values: List[float], threshold: float) -> int:
@@ -32,40 +37,47 @@ def _compute_streak(values: List[float], threshold: float) -> int:
     Cuenta cuántos juegos consecutivos (desde el más reciente hacia atrás)
     cumplen >= threshold.
     """
-    streak = 0
-    for v in values:
-        if v >= threshold:
-            streak += 1
-        else:
-            break
-    return streak
+    # Índice del primer juego que no llega = largo de la racha
+    return next(
+        (i for i, v in enumerate(values) if v < threshold),
+        len(values),
+    )
+
+
+def _stat_indices(names: Tuple[str, ...]) -> Dict[str, Optional[int]]:
+    """
+    stat_key -> índice de columna en `names`.
+    ESPN repite las mismas cabeceras en todos los gamelogs, así que la
+    búsqueda por alias queda memoizada en _market_stat_index.
+    """
+    return {stat_key: _market_stat_index(names, stat_key) for stat_key in DEFAULT_THRESHOLDS}
+
+
+def _gamelog_rows(gamelog: Dict[str, Any]) -> List[List[Any]]:
+    """
+    Filas de stats de temporada regular, de la más reciente a la más antigua.
+    Se extraen una sola vez por jugador y se reutilizan para cada stat.
+    """
+    events = _extract_regular_season_events(gamelog)
+    return [
+        stats
+        for ev in reversed(events)
+        if isinstance(stats := ev.get("stats", []), list)
+    ]
 
 
 def _extract_stat_series(
-    gamelog: Dict[str, Any],
-    stat_key: str,
+    rows: List[List[Any]],
+    idx: Optional[int],
 ) -> List[float]:
-    names = gamelog.get("names", [])
-    idx = _find_stat_index(names, ALIASES[stat_key])
     if idx is None:
         return []
 
-    events = _extract_regular_season_events(gamelog)
-    if not events:
-        return []
-
-    # Order cronológico -> tomamos recientes desde el final
-    recent = list(reversed(events))
-
     out: List[float] = []
-    for ev in recent:
-        stats = ev.get("stats", [])
-        if isinstance(stats, list) and len(stats) > idx:
-            raw = stats[idx]
-            try:
-                out.append(float(str(raw).replace(",", "")))
-            except (TypeError, ValueError):
-                out.append(0.0)
+    for stats in rows:
+        if len(stats) > idx:
+            val = to_float(stats[idx])
+            out.append(0.0 if val is None else val)
     return out
 
 
@@ -90,6 +102,62 @@ def _get_teams_playing(date: str) -> List[str]:
     return sorted(list(set(teams)))
 
 
+def _player_streaks(
+    p: Dict[str, Any],
+    season: int,
+    season_type: int,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Trae el gamelog de un jugador y devuelve sus rachas como (stat_key, entrada).
+    Si falla el fetch devuelve lista vacía para no tumbar el batch completo.
+    """
+    name = p.get("name", "N/A")
+
+    try:
+        gamelog = fetch_nba_player_gamelog(
+            athlete_id=p["athlete_id"],
+            season=season,
+            season_type=season_type,
+        )
+    except Exception:
+        return []
+
+    names = gamelog.get("names", [])
+    if not isinstance(names, list):
+        return []
+    indices = _stat_indices(tuple(names))
+    rows = _gamelog_rows(gamelog)
+    if not rows:
+        return []
+
+    out: List[Tuple[str, Dict[str, Any]]] = []
+    for stat_key, thresholds in DEFAULT_THRESHOLDS.items():
+        series = _extract_stat_series(rows, indices[stat_key])
+        if len(series) < _MIN_STREAK:
+            continue
+
+        # Racha >= _MIN_STREAK con threshold th  <=>  th <= mínimo de los
+        # últimos _MIN_STREAK juegos: el primer threshold válido sale directo
+        # sin recorrer la serie una vez por threshold.
+        floor = min(series[:_MIN_STREAK])
+        th = next((t for t in thresholds if t <= floor), None)
+        if th is None:
+            continue
+
+        out.append(
+            (
+                stat_key,
+                {
+                    "player_name": name,
+                    "team_abbr": p.get("team_abbr"),
+                    "threshold": th,
+                    "streak": _compute_streak(series, th),
+                },
+            )
+        )
+    return out
+
+
 def build_streaks_for_date(
     date: str,
     season: int,
@@ -105,30 +173,6 @@ def build_streaks_for_date(
 
     team_abbrs = _get_teams_playing(date)
 
-    players: List[Dict[str, Any]] = []
-
-    for abbr in team_abbrs:
-        roster = fetch_nba_team_roster_by_abbr(abbr)
-        if not roster:
-            continue
-
-        for p in roster.get("players", []):
-            if p.get("position") in ("G", "F", "C", "PG", "SG", "SF", "PF"):
-                players.append(p)
-            else:
-                # si no trae posición clara, igual lo dejamos pasar
-                players.append(p)
-
-    # Unique por athlete_id
-    seen = set()
-    unique_players = []
-    for p in players:
-        aid = p.get("athlete_id")
-        if not aid or aid in seen:
-            continue
-        seen.add(aid)
-        unique_players.append(p)
-
     # Contenedores de resultados
     buckets = {
         "points": [],
@@ -137,42 +181,47 @@ def build_streaks_for_date(
         "threes_made": [],
     }
 
-    for p in unique_players:
-        athlete_id = p["athlete_id"]
-        name = p.get("name", "N/A")
+    # Pipeline en un solo pool: apenas llega un roster se encolan los gamelogs
+    # de sus jugadores, sin esperar a que terminen los demás rosters.
+    # athlete_id -> future de _player_streaks (unique por athlete_id)
+    streak_futures: Dict[Any, Future] = {}
 
-        try:
-            gamelog = fetch_nba_player_gamelog(
-                athlete_id=athlete_id,
-                season=season,
-                season_type=season_type,
-            )
-        except Exception:
-            continue
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+        roster_futures = [
+            ex.submit(fetch_nba_team_roster_by_abbr, abbr) for abbr in team_abbrs
+        ]
 
-        for stat_key in buckets.keys():
-            series = _extract_stat_series(gamelog, stat_key)
-            if not series:
+        for fut in as_completed(roster_futures):
+            roster = fut.result()
+            if not roster:
                 continue
-
-            # Probamos thresholds en orden descendente
-            for th in DEFAULT_THRESHOLDS[stat_key]:
-                streak_len = _compute_streak(series, th)
-                if streak_len >= 5:
-                    # Guardamos una entrada por el primer threshold válido
-                    buckets[stat_key].append(
-                        {
-                            "player_name": name,
-                            "team_abbr": p.get("team_abbr"),
-                            "threshold": th,
-                            "streak": streak_len,
-                        }
+            # Se aceptan todas las posiciones (incluso sin posición clara)
+            for p in roster.get("players", []):
+                aid = p.get("athlete_id")
+                if aid and aid not in streak_futures:
+                    streak_futures[aid] = ex.submit(
+                        _player_streaks, p, season, season_type
                     )
-                    break
+
+        # Resultados en orden de equipo/roster (no de llegada) para que el
+        # orden de las rachas empatadas sea estable entre llamadas
+        seen = set()
+        for fut in roster_futures:
+            roster = fut.result()
+            if not roster:
+                continue
+            for p in roster.get("players", []):
+                aid = p.get("athlete_id")
+                if not aid or aid in seen:
+                    continue
+                seen.add(aid)
+                for stat_key, entry in streak_futures[aid].result():
+                    buckets[stat_key].append(entry)
 
     # Ordenar por streak desc
-    for k in buckets.keys():
-        buckets[k] = sorted(buckets[k], key=lambda x: x["streak"], reverse=True)
+    # sort() in-place con itemgetter: sin copiar la lista ni llamar a una lambda
+    for entries in buckets.values():
+        entries.sort(key=_BY_STREAK, reverse=True)
 
     # Formato final amigable
     return {
@@ -1,31 +1,76 @@
 # app/services/wspm_nfl_engine.py
 
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Any, Collection, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from app.utils.parsing import to_float
+
+# Mapeo de market_type (externo) a nombre interno del gamelog ("names").
+# Constantes de módulo de solo lectura: se construyen una vez al importar.
+MARKET_TO_NAME: Mapping[str, str] = MappingProxyType(
+    {
+        "receiving_yards": "receivingYards",
+        "rushing_yards": "rushingYards",
+        "passing_yards": "passingYards",
+        # aquí puedes ir agregando más: "receptions": "receptions", etc.
+    }
+)
+
+# Mapeo "legacy" (formato stats: [{"name": ..., "value": ...}]).
+# frozenset: el `name in stat_names` por cada stat es O(1).
+MARKET_STAT_LEGACY: Mapping[str, FrozenSet[str]] = MappingProxyType(
+    {
+        "receiving_yards": frozenset({"recYds", "yards", "REC_YDS"}),
+        "rushing_yards": frozenset({"rushYds", "yards", "RUSH_YDS"}),
+        "passing_yards": frozenset({"passYds", "yards", "PASS_YDS"}),
+    }
+)
+
+# Cuántos eventos como máximo se revisan por cada juego de la ventana
+_SCAN_FACTOR = 3
+
+# Datos derivados por identidad del gamelog (eventos de temporada regular,
+# proyecciones por (market_type, games_window)). El gamelog sale de la caché
+# de ESPN (mismo objeto entre requests mientras no expire), así que repetir
+# proyecciones del mismo jugador no vuelve a recorrerlo; cuando la caché trae
+# un gamelog nuevo, su identidad cambia y se recalcula solo.
+# Se guarda la referencia al gamelog para que su id() no se reutilice
+# mientras la entrada viva.
+_GAMELOG_MEMO: "OrderedDict[int, Tuple[Dict[str, Any], Dict[Any, Any]]]" = OrderedDict()
+_GAMELOG_MEMO_MAX = 64
+_GAMELOG_MEMO_LOCK = threading.Lock()
 
 
 # -----------------------------------------------------------------------------
 # (Legacy) Helper para formatos antiguos tipo "stats": [{"name": "...", ...}]
 # Lo dejo por compatibilidad, pero la lógica principal ya NO depende de esto.
 # -----------------------------------------------------------------------------
-def _extract_stat_from_game(game: Any, stat_names: List[str]) -> Optional[float]:
+def _extract_stat_from_game(game: Any, stat_names: Collection[str]) -> Optional[float]:
     """
     Intenta extraer un stat numérico de un "game" del gamelog de ESPN en formato
     antiguo (lista de dicts con name/value).
 
-    - stat_names: lista de nombres posibles, ej. ["recYds", "yards"].
+    - stat_names: nombres posibles, ej. {"recYds", "yards"} (idealmente un set).
     """
-    if not isinstance(game, Dict):
+    if not isinstance(game, dict):
         return None
 
     # Caso 1: stats directos en el nivel del partido
     stats = game.get("stats")
     if isinstance(stats, list):
         for st in stats:
-            if not isinstance(st, Dict):
+            if not isinstance(st, dict):
                 continue
             name = st.get("name")
             if name in stat_names:
-                val = st.get("value") or st.get("displayValue")
+                # `or` descartaría un value 0 legítimo: solo caemos a displayValue si falta
+                val = st.get("value")
+                if val is None:
+                    val = st.get("displayValue")
                 try:
                     return float(val)
                 except (TypeError, ValueError):
@@ -33,16 +78,18 @@ def _extract_stat_from_game(game: Any, stat_names: List[str]) -> Optional[float]
 
     # Caso 2 (fallback): quizá dentro de otro sub-objeto
     boxscore = game.get("boxscore")
-    if isinstance(boxscore, Dict):
+    if isinstance(boxscore, dict):
         for key in ["passing", "rushing", "receiving", "defensive"]:
             group = boxscore.get(key)
             if isinstance(group, list):
                 for st in group:
-                    if not isinstance(st, Dict):
+                    if not isinstance(st, dict):
                         continue
                     name = st.get("name")
                     if name in stat_names:
-                        val = st.get("value") or st.get("displayValue")
+                        val = st.get("value")
+                        if val is None:
+                            val = st.get("displayValue")
                         try:
                             return float(val)
                         except (TypeError, ValueError):
@@ -85,23 +132,71 @@ def _get_regular_season_events_from_indexed_gamelog(
         ]
       }
     """
-    events: List[Dict[str, Any]] = []
-    season_types = gamelog.get("seasonTypes", [])
-
-    for st in season_types:
-        # splitType "2" suele corresponder a Regular Season
-        if st.get("splitType") == "2" or str(st.get("displayName", "")).endswith("Regular Season"):
-            categories = st.get("categories", [])
-            for cat in categories:
-                cat_events = cat.get("events")
-                if isinstance(cat_events, list):
-                    events.extend(cat_events)
-            # si ya encontramos Regular Season, podemos salir
-            break
-
+    # splitType "2" suele corresponder a Regular Season; nos quedamos con el
+    # primero que coincida (el `or` ya evita el endswith si splitType matchea)
+    regular = next(
+        (
+            st
+            for st in gamelog.get("seasonTypes", [])
+            if st.get("splitType") == "2"
+            or str(st.get("displayName", "")).endswith("Regular Season")
+        ),
+        None,
+    )
+    if regular is None:
+        return []
+
+    return list(
+        chain.from_iterable(
+            cat_events
+            for cat in regular.get("categories", [])
+            if isinstance(cat_events := cat.get("events"), list)
+        )
+    )
+
+
+def _gamelog_memo(gamelog: Dict[str, Any]) -> Dict[Any, Any]:
+    """Dict de datos derivados de este gamelog (LRU acotado por identidad)."""
+    key = id(gamelog)
+    with _GAMELOG_MEMO_LOCK:
+        hit = _GAMELOG_MEMO.get(key)
+        if hit is not None and hit[0] is gamelog:
+            _GAMELOG_MEMO.move_to_end(key)
+            return hit[1]
+
+        memo: Dict[Any, Any] = {}
+        _GAMELOG_MEMO[key] = (gamelog, memo)
+        while len(_GAMELOG_MEMO) > _GAMELOG_MEMO_MAX:
+            _GAMELOG_MEMO.popitem(last=False)
+        return memo
+
+
+def _regular_season_events_cached(gamelog: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    _get_regular_season_events_from_indexed_gamelog memoizado por identidad.
+    La lista devuelta se comparte: no debe mutarse.
+    """
+    memo = _gamelog_memo(gamelog)
+    events = memo.get("events")
+    if events is None:
+        events = memo["events"] = _get_regular_season_events_from_indexed_gamelog(gamelog)
     return events
 
 
+@lru_cache(maxsize=32)
+def _build_index_map(names: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    market_type -> índice en `names` para un juego de cabeceras.
+    ESPN repite las mismas `names` en todos los gamelogs NFL, así que el
+    names.index() se resuelve una vez por forma y luego es un hit de caché.
+    """
+    return {
+        market: names.index(internal)
+        for market, internal in MARKET_TO_NAME.items()
+        if internal in names
+    }
+
+
 # -----------------------------------------------------------------------------
 # LÓGICA PRINCIPAL: calcular base_projection desde gamelog REAL de ESPN
 # -----------------------------------------------------------------------------
@@ -127,24 +222,35 @@ def compute_base_projection_from_gamelog(
 
     Si no puede encontrar el stat o no hay suficientes datos,
     devuelve 0.0 (tu endpoint /auto-projection-report decide si lanza error).
+
+    El resultado se memoiza por (gamelog, market_type, games_window).
     """
 
-    if not gamelog or not isinstance(gamelog, Dict):
+    if not gamelog or not isinstance(gamelog, dict):
         # No hay gamelog → no hay nada que promediar
         return 0.0
 
+    memo = _gamelog_memo(gamelog)
+    key = (market_type, games_window)
+    projection = memo.get(key)
+    if projection is None:
+        projection = memo[key] = _compute_base_projection(
+            gamelog, market_type, games_window
+        )
+    return projection
+
+
+def _compute_base_projection(
+    gamelog: Dict[str, Any],
+    market_type: str,
+    games_window: int,
+) -> float:
+    """Cálculo sin memoizar de compute_base_projection_from_gamelog."""
+
     # -------------------------------------------------------------------------
-    # 1) Mapeo de market_type (externo) a nombre interno del gamelog ("names")
+    # 1) ¿market_type soportado? (ver MARKET_TO_NAME)
     # -------------------------------------------------------------------------
-    market_to_name: Dict[str, str] = {
-        "receiving_yards": "receivingYards",
-        "rushing_yards": "rushingYards",
-        "passing_yards": "passingYards",
-        # aquí puedes ir agregando más: "receptions": "receptions", etc.
-    }
-
-    target_stat_name = market_to_name.get(market_type)
-    if not target_stat_name:
+    if market_type not in MARKET_TO_NAME:
         # Market no soportado aún
         return 0.0
 
@@ -156,39 +262,32 @@ def compute_base_projection_from_gamelog(
         # No viene el arreglo "names" → intentamos fallback legacy
         return _compute_base_projection_legacy(gamelog, market_type, games_window)
 
-    try:
-        stat_idx = stat_names_list.index(target_stat_name)
-    except ValueError:
+    stat_idx = _build_index_map(tuple(stat_names_list)).get(market_type)
+    if stat_idx is None:
         # El stat no se encuentra en la lista de nombres → fallback
         return _compute_base_projection_legacy(gamelog, market_type, games_window)
 
     # -------------------------------------------------------------------------
     # 3) Extraer partidos de temporada regular y tomar los más recientes
     # -------------------------------------------------------------------------
-    regular_events = _get_regular_season_events_from_indexed_gamelog(gamelog)
+    regular_events = _regular_season_events_cached(gamelog)
     if not regular_events:
         # No hay eventos de temporada regular → fallback
         return _compute_base_projection_legacy(gamelog, market_type, games_window)
 
-    # Ordénalos del más reciente al más antiguo (la API suele traerlos en orden,
-    # pero invertimos para estar seguros) y toma la ventana de N juegos.
-    recent_events = list(reversed(regular_events))
-
+    # Recorremos del más reciente al más antiguo (la API suele traerlos en
+    # orden) sin copiar la lista, y cortamos al llenar la ventana de N juegos.
+    # El escaneo se acota a _SCAN_FACTOR * N eventos por si hay muchas filas
+    # sin el stat al final (bye weeks, DNP).
     values: List[float] = []
-    for event in recent_events:
-        stats_array = event.get("stats", [])
-        if not isinstance(stats_array, list):
+    for event in islice(reversed(regular_events), games_window * _SCAN_FACTOR):
+        stats_array = event.get("stats")
+        if not isinstance(stats_array, list) or len(stats_array) <= stat_idx:
             continue
 
-        if len(stats_array) <= stat_idx:
-            continue
-
-        raw_val = stats_array[stat_idx]
-
-        try:
-            # Los stats suelen venir como string, a veces con comas "1,234".
-            val = float(str(raw_val).replace(",", ""))
-        except (TypeError, ValueError):
+        # Los stats suelen venir como string, a veces con comas "1,234".
+        val = to_float(stats_array[stat_idx])
+        if val is None:
             continue
 
         # Aquí NO filtramos los ceros; asumimos que 0 es un valor válido
@@ -222,14 +321,7 @@ def _compute_base_projection_legacy(
     Usa la lógica vieja con _extract_stat_from_game.
     """
 
-    # Mapeo "legacy"
-    market_stat_legacy: Dict[str, List[str]] = {
-        "receiving_yards": ["recYds", "yards", "REC_YDS"],
-        "rushing_yards": ["rushYds", "yards", "RUSH_YDS"],
-        "passing_yards": ["passYds", "yards", "PASS_YDS"],
-    }
-
-    stat_names = market_stat_legacy.get(market_type)
+    stat_names = MARKET_STAT_LEGACY.get(market_type)
     if not stat_names:
         return 0.0
 
@@ -238,11 +330,9 @@ def _compute_base_projection_legacy(
     if not isinstance(games, list) or not games:
         return 0.0
 
-    # Usamos los últimos N partidos (más recientes)
-    recent_games = list(reversed(games))[:games_window]
-
+    # Usamos los últimos N partidos (más recientes) sin copiar la lista
     values: List[float] = []
-    for g in recent_games:
+    for g in islice(reversed(games), games_window):
         val = _extract_stat_from_game(g, stat_names)
         if val is not None:
             values.append(val)
@@ -1,21 +1,73 @@
+import random
+import threading
 import time
-from typing import Any, Dict, Tuple
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple
 
-# Cache muy simple en memoria (clave -> (timestamp, valor))
-_cache: Dict[str, Tuple[float, Any]] = {}
+# Máximo de entradas antes de expulsar la menos usada (LRU)
+_MAX = 4096
+
+# Cache en memoria acotada (clave -> (timestamp monotónico, valor, ttl propio o None)).
+# time.monotonic() no salta con ajustes de NTP / reloj del sistema.
+_cache: "OrderedDict[str, Tuple[float, Any, Optional[float]]]" = OrderedDict()
+_lock = threading.RLock()
+
+# Locks de llamadas en vuelo por clave; se liberan solos cuando nadie los usa
+_inflight: "weakref.WeakValueDictionary[Any, threading.Lock]" = weakref.WeakValueDictionary()
+_inflight_guard = threading.Lock()
+
+
+def jittered_ttl(ttl_seconds: float, spread: float = 0.1) -> float:
+    """
+    TTL con ±spread (10% por defecto) aleatorio, para que las claves que se
+    llenan en la misma ráfaga (ej. scoreboards de todas las ligas) no expiren
+    todas a la vez y provoquen una avalancha de refetch a ESPN.
+    """
+    return ttl_seconds * random.uniform(1.0 - spread, 1.0 + spread)
 
 
 def get_from_cache(key: str, ttl_seconds: int = 60):
-    now = time.time()
-    if key in _cache:
-        ts, value = _cache[key]
-        if now - ts <= ttl_seconds:
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        ts, value, entry_ttl = entry
+        # El TTL guardado con la entrada (si lo hay) manda sobre el del lector
+        if now - ts <= (ttl_seconds if entry_ttl is None else entry_ttl):
+            _cache.move_to_end(key)
             return value
-        else:
-            # Expirado
-            del _cache[key]
+        # Expirado
+        _cache.pop(key, None)
     return None
 
 
-def set_in_cache(key: str, value: Any):
-    _cache[key] = (time.time(), value)
+def set_in_cache(key: str, value: Any, ttl_seconds: Optional[float] = None):
+    with _lock:
+        _cache[key] = (time.monotonic(), value, ttl_seconds)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX:
+            _cache.popitem(last=False)
+
+
+def single_flight(func: Callable) -> Callable:
+    """
+    Decorador para fetchers cacheados: llamadas concurrentes con los mismos
+    argumentos se serializan, así solo la primera va a ESPN y las demás,
+    al entrar, encuentran la respuesta ya guardada por get_from_cache.
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (name, args, tuple(kwargs.items())) if kwargs else (name, args)
+        with _inflight_guard:
+            lock = _inflight.get(key)
+            if lock is None:
+                lock = _inflight[key] = threading.Lock()
+        with lock:
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,48 @@
+import hashlib
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.config import settings
+
+
+def cached_json_response(
+    request: Request,
+    body: bytes,
+    max_age: int = settings.espn_cache_ttl_seconds,
+) -> Response:
+    """
+    Envuelve un JSON ya serializado con ETag fuerte + Cache-Control.
+
+    Si el cliente manda If-None-Match con el mismo ETag responde 304 sin cuerpo,
+    así el frontend / proxy no vuelve a descargar datos que no cambiaron.
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_model_response(
+    request: Request,
+    model: BaseModel,
+    max_age: int = settings.espn_cache_ttl_seconds,
+) -> Response:
+    """
+    cached_json_response para un modelo de respuesta pydantic.
+
+    El modelo se serializa directo con pydantic-core (model_dump_json): si se
+    devolviera el objeto, FastAPI lo volvería a validar y convertir vía
+    response_model antes de codificarlo.
+    """
+    return cached_json_response(request, model.model_dump_json().encode(), max_age)
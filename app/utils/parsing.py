@@ -0,0 +1,41 @@
+from typing import Any, Optional
+
+
+def to_int(value: Any) -> Optional[int]:
+    """
+    int() sin excepciones para los valores típicos de ESPN
+    (int, bool, "3", "-1", None). Devuelve None si no es convertible.
+    """
+    # Caso común primero: ya es int (type() is int es más rápido que isinstance)
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdecimal() or (value[:1] == "-" and value[1:].isdecimal()):
+            return int(value)
+        return None
+    if isinstance(value, (int, float)):
+        # bool (starter=True -> 1) y floats
+        return int(value)
+    return None
+
+
+def to_float(value: Any) -> Optional[float]:
+    """
+    float() tolerante para celdas de stats de ESPN (25, "25", "1,234").
+    Devuelve None si no es convertible.
+    """
+    # Caso común: número o string sin separadores -> float() directo en C
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    # Solo las celdas con separador de miles pasan por replace()
+    if isinstance(value, str) and "," in value:
+        try:
+            return float(value.replace(",", ""))
+        except ValueError:
+            return None
+    return None
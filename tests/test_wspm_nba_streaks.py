@@ -0,0 +1,54 @@
+import random
+
+from app.services import wspm_nba_streaks
+from app.services.wspm_nba_streaks import DEFAULT_THRESHOLDS, _compute_streak, _player_streaks
+
+
+def _old_pick(series, thresholds):
+    # Escalera original: primer threshold (en orden) con racha >= 5
+    for th in thresholds:
+        streak = 0
+        for v in series:
+            if v >= th:
+                streak += 1
+            else:
+                break
+        if streak >= 5:
+            return th, streak
+    return None
+
+
+def _gamelog(points):
+    # Eventos en orden cronológico; las rachas se leen desde el final
+    events = [{"stats": [str(v)]} for v in reversed(points)]
+    return {
+        "names": ["points"],
+        "seasonTypes": [{"splitType": "2", "categories": [{"events": events}]}],
+    }
+
+
+def test_compute_streak():
+    assert _compute_streak([20, 18, 9, 30], 15) == 2
+    assert _compute_streak([20, 18], 15) == 2
+    assert _compute_streak([], 15) == 0
+
+
+def test_threshold_pick_matches_per_threshold_loop(monkeypatch):
+    rng = random.Random(7)
+    thresholds = DEFAULT_THRESHOLDS["points"]
+
+    for _ in range(500):
+        series = [rng.randint(5, 30) for _ in range(rng.randint(0, 12))]
+        monkeypatch.setattr(
+            wspm_nba_streaks,
+            "fetch_nba_player_gamelog",
+            lambda **kwargs: _gamelog(series),
+        )
+
+        got = [
+            (entry["threshold"], entry["streak"])
+            for stat_key, entry in _player_streaks({"athlete_id": "1"}, 2025, 2)
+            if stat_key == "points"
+        ]
+        expected = _old_pick(series, thresholds)
+        assert got == ([expected] if expected else [])
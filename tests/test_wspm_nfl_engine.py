@@ -0,0 +1,11 @@
+from app.services.wspm_nfl_engine import _extract_stat_from_game
+
+
+def test_extract_stat_keeps_zero_value():
+    game = {"stats": [{"name": "recYds", "value": 0, "displayValue": "--"}]}
+    assert _extract_stat_from_game(game, {"recYds"}) == 0.0
+
+
+def test_extract_stat_falls_back_to_display_value():
+    game = {"stats": [{"name": "recYds", "displayValue": "45"}]}
+    assert _extract_stat_from_game(game, {"recYds"}) == 45.0